@@ -0,0 +1,163 @@
+import functools
+import glob
+import hashlib
+import json
+import os.path
+import sys
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import profiling
+
+# Answers of compute_part_* kept on disk, so solving an input that was solved before is a file read. Enabled by
+# pointing AOC_ANSWER_CACHE to a directory. Entries are keyed by the day, the part, the SHA-256 of the input bytes and
+# a hash of the solver (the day's code and everything in common/), so any change to an input or the code misses.
+# The cache holds at most AOC_ANSWER_CACHE_SIZE bytes (default 64 MB); beyond that the least recently used entries
+# are evicted, with the modification time of an entry serving as the time of its last use.
+#
+# It is bypassed while profiling, and the benchmark and the runner's memory accounting switch it off, since a cached
+# answer would make them measure nothing.
+
+COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZE = 64 * 1024 * 1024
+
+
+def cache_dir():
+    return os.environ.get("AOC_ANSWER_CACHE")
+
+
+def disable():
+    os.environ.pop("AOC_ANSWER_CACHE", None)
+
+
+def max_size():
+    return int(os.environ.get("AOC_ANSWER_CACHE_SIZE", DEFAULT_SIZE))
+
+
+@functools.cache
+def solver_version(module_file):
+    digest = hashlib.sha256()
+    for path in [module_file] + sorted(glob.glob(os.path.join(COMMON_DIR, "*.py"))):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_entry_path(day, part, input_file, module_file, keyed_options=None):
+    options = json.dumps(keyed_options, sort_keys=True) if keyed_options else ""
+    key = hashlib.sha256(f"{day}:{part}:{hash_file(input_file)}:{solver_version(module_file)}:{options}".encode()).hexdigest()
+    return os.path.join(cache_dir(), f"{day}-{part}-{key}.json")
+
+
+def load(path):
+    try:
+        with open(path, "r") as f:
+            answer = json.load(f)["answer"]
+    except (OSError, ValueError, KeyError):
+        return False, None
+    os.utime(path) # mark as recently used
+    return True, answer
+
+
+def store(path, answer):
+    os.makedirs(cache_dir(), exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"answer": answer}, f)
+    os.replace(path + ".tmp", path)
+    evict(max_size())
+
+
+def get_entries():
+    # (path, size, time of last use) of every cached answer, least recently used first
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir(), "*.json")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue # evicted by another process
+        entries.append((path, stat.st_size, stat.st_mtime))
+    return sorted(entries, key=lambda entry: entry[2])
+
+
+def evict(size):
+    entries = get_entries()
+    total = sum([entry[1] for entry in entries])
+    for path, entry_size, _ in entries:
+        if total <= size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= entry_size
+
+
+def get_defaults(function):
+    code = function.__code__
+    names = code.co_varnames[:code.co_argcount]
+    return dict(zip(names[len(names) - len(function.__defaults__ or ()):], function.__defaults__ or ()))
+
+
+def cached_answer(compute_part=None, keyed=()):
+    # Decorator for compute_part_N(input_file_name="input.txt", **options). Answers must be JSON values (ints and
+    # strings). Options such as workers only change how an answer is computed, so they are not part of the key;
+    # options that change the answer itself must be listed in keyed, as in @cached_answer(keyed=["tolerance"]).
+    if compute_part is None:
+        return functools.partial(cached_answer, keyed=keyed)
+    defaults = get_defaults(compute_part)
+    module_file = os.path.abspath(sys.modules[compute_part.__module__].__file__)
+    day_dir = os.path.dirname(module_file)
+    day = os.path.basename(day_dir)
+    part = compute_part.__name__[len("compute_part_"):]
+
+    @functools.wraps(compute_part)
+    def wrapper(input_file_name="input.txt", **options):
+        if not cache_dir() or profiling.enabled():
+            return compute_part(input_file_name, **options)
+        keyed_options = {name: options.get(name, defaults.get(name)) for name in keyed}
+        path = get_entry_path(day, part, os.path.join(day_dir, input_file_name), module_file, keyed_options)
+        found, answer = load(path)
+        if not found:
+            answer = compute_part(input_file_name, **options)
+            store(path, answer)
+        return answer
+
+    return wrapper
+
+
+def main(argv=None):
+    import argparse # only for the command line, as every day imports this module
+    parser = argparse.ArgumentParser(description="Inspect or clear the answer cache in AOC_ANSWER_CACHE.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("days", nargs="*", help="only entries of these days (default: all)")
+    args = parser.parse_args(argv)
+    if not cache_dir():
+        exit("AOC_ANSWER_CACHE is not set.")
+
+    entries = [entry for entry in get_entries() if not args.days or os.path.basename(entry[0]).split("-")[0] in args.days]
+    if args.command == "clear":
+        for path, _, _ in entries:
+            os.remove(path)
+        print(f"Removed {len(entries)} cached answers from {cache_dir()}")
+    else:
+        counts = {}
+        for path, size, _ in entries:
+            day = os.path.basename(path).split("-")[0]
+            counts[day] = [counts.get(day, [0, 0])[0] + 1, counts.get(day, [0, 0])[1] + size]
+        for day in sorted(counts.keys()):
+            print(f"{day}: {counts[day][0]} answers, {counts[day][1]} bytes")
+        print(f"Total: {len(entries)} answers, {sum([entry[1] for entry in entries])} of at most {max_size()} bytes in {cache_dir()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
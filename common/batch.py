@@ -0,0 +1,80 @@
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import json
+import os.path
+import sys
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import progress
+from common.runner import discover_days, discover_parts, load_day, solve
+
+
+def expand_inputs(patterns):
+    # Directories stand for all files directly inside them; everything else is a glob. Paths are made absolute, as
+    # the solvers resolve relative names against their own day directory.
+    inputs = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        else:
+            paths = sorted(glob.glob(pattern))
+        inputs += [os.path.abspath(path) for path in paths if os.path.isfile(path)]
+    return list(dict.fromkeys(inputs)) # without duplicates, in order
+
+
+def init_worker(day):
+    # Runs once per worker: the day's module (compiled regexes, functools caches of input-independent helpers) stays
+    # loaded and warm for every input the worker gets
+    progress.configure(level=progress.SILENT)
+    load_day(day)
+
+
+def solve_chunk(day, parts, input_files):
+    return [solve(day, part, input_file) for input_file in input_files for part in parts]
+
+
+def get_chunks(items, chunksize):
+    return [items[k:k+chunksize] for k in range(0, len(items), chunksize)]
+
+
+def run_batch(day, inputs, parts=None, workers=None, chunksize=None):
+    # Yields a result per input and part (as returned by common.runner.solve) as soon as its chunk is done
+    parts = parts or discover_parts(load_day(day))
+    workers = workers or os.cpu_count()
+    chunksize = chunksize or max(1, len(inputs) // (4*workers)) # a few chunks per worker balances uneven inputs
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(day,)) as executor:
+        futures = [executor.submit(solve_chunk, day, parts, chunk) for chunk in get_chunks(inputs, chunksize)]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many input files of one day in parallel, streaming the results as JSON lines.")
+    parser.add_argument("day", help="day to run, e.g. day05")
+    parser.add_argument("inputs", nargs="+", help="input files, directories of input files or glob patterns")
+    parser.add_argument("--parts", nargs="*", type=int, default=None, help="parts to solve (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="size of the process pool (default: number of cores)")
+    parser.add_argument("--chunksize", type=int, default=None, help="inputs handed to a worker at once (default: a quarter of an even share)")
+    parser.add_argument("--output", default=None, help="write the JSON lines to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.day not in discover_days([args.day]):
+        exit(f"Unknown day {args.day}.")
+    inputs = expand_inputs(args.inputs)
+    if len(inputs) == 0:
+        exit(f"No input files found for {' '.join(args.inputs)}.")
+    n_errors = 0
+    with open(args.output, "w") if args.output else contextlib.nullcontext(sys.stdout) as out:
+        for result in run_batch(args.day, inputs, args.parts, args.workers, args.chunksize):
+            n_errors += result["error"] is not None
+            out.write(json.dumps(result, default=str) + "\n")
+            out.flush()
+    return 1 if n_errors > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import argparse
+import contextlib
+import glob
+import json
+import multiprocessing
+import os.path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import answers, progress
+from common.generators import GENERATORS, write_input
+from common.runner import ROOT, discover_days, discover_parts, load_day
+
+
+def discover_inputs(day):
+    return ["input.txt"] + sorted(os.path.basename(path) for path in glob.glob(os.path.join(ROOT, day, "sample_input*.txt")))
+
+
+def percentile(times, p):
+    # Nearest-rank percentile; with few repetitions this is simply one of the measured runs
+    ordered = sorted(times)
+    return ordered[max(0, min(len(ordered)-1, -(-len(ordered)*p//100) - 1))]
+
+
+def bench(day, part, input_file_name, warmup, repeat, max_time):
+    function = getattr(load_day(day), f"compute_part_{part}")
+    times = []
+    answer = None
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for k in range(warmup + repeat):
+            start = time.perf_counter()
+            answer = function(input_file_name)
+            elapsed = time.perf_counter() - start
+            if k >= warmup:
+                times.append(elapsed)
+            # A single slow part should not hold up the whole suite; stop repeating once it used up its budget
+            if sum(times) >= max_time and len(times) > 0:
+                break
+    return {
+        "answer": answer if isinstance(answer, (int, str)) else repr(answer),
+        "runs": len(times),
+        "min": min(times),
+        "mean": statistics.fmean(times),
+        "median": statistics.median(times),
+        "p95": percentile(times, 95),
+    }
+
+
+def bench_worker(conn, job, warmup, repeat, max_time):
+    try:
+        conn.send(bench(*job, warmup, repeat, max_time))
+    except BaseException as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+    conn.close()
+
+
+def run_benchmarks(jobs, warmup=1, repeat=5, max_time=10.0, timeout=120.0, workers=1):
+    # Each job runs in a fresh process: solvers keep module-level caches (e.g. day11, day19, day22) that would
+    # otherwise leak between inputs, and a part that never finishes on some input can be killed after timeout.
+    pending = list(jobs)
+    active = {}
+    while pending or active:
+        while pending and len(active) < workers:
+            job = pending.pop(0)
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=bench_worker, args=(sender, job, warmup, repeat, max_time))
+            process.start()
+            sender.close()
+            active[job] = (process, receiver, time.perf_counter())
+        for job, (process, receiver, started) in list(active.items()):
+            if receiver.poll(0.01):
+                try:
+                    result = receiver.recv()
+                except EOFError:
+                    result = {"error": "worker exited without a result"}
+            elif not process.is_alive():
+                result = {"error": f"worker exited with code {process.exitcode}"}
+            elif time.perf_counter() - started > timeout:
+                process.kill()
+                result = {"error": f"timed out after {timeout:.0f}s"}
+            else:
+                continue
+            process.join()
+            del active[job]
+            yield job, result
+
+
+def job_key(job):
+    day, part, input_file_name = job
+    return f"{day}/part{part}/{os.path.basename(input_file_name)}"
+
+
+def compare(results, baseline, threshold, min_delta=0.001):
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get("results", {}).get(key)
+        if old is None or "error" in result or "error" in old:
+            continue
+        if result["median"] > old["median"] * (1 + threshold) and result["median"] - old["median"] > min_delta:
+            regressions.append(f"{key}: median {old['median']:.4f}s -> {result['median']:.4f}s ({result['median']/old['median']-1:+.0%})")
+        if result["answer"] != old["answer"]:
+            regressions.append(f"{key}: answer changed from {old['answer']} to {result['answer']}")
+    return regressions
+
+
+def format_result(key, result):
+    if "error" in result:
+        return f"{key:<36} ERROR {result['error']}"
+    return f"{key:<36} median {result['median']:9.4f}s  p95 {result['p95']:9.4f}s  min {result['min']:9.4f}s  ({result['runs']} runs)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every compute_part_* against the real and sample inputs.")
+    parser.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    parser.add_argument("--inputs", nargs="*", default=None, help="input files to use (default: input.txt and all sample_input*.txt)")
+    parser.add_argument("--scale", nargs="*", type=float, default=[], help="also run on synthetic inputs this many times the size of input.txt, e.g. --scale 10 100 1000")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("--scaled-dir", default=None, help="keep the synthetic inputs in this directory (default: a temporary one)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per part and input")
+    parser.add_argument("--max-time", type=float, default=10.0, help="stop repeating a part once its timed runs exceed this many seconds")
+    parser.add_argument("--timeout", type=float, default=300.0, help="kill a part that takes longer than this many seconds")
+    parser.add_argument("--workers", type=int, default=1, help="benchmarks run in parallel (default 1 for stable timings)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a JSON baseline written by --save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative median slowdown that counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.001, help="ignore slowdowns smaller than this many seconds (timer noise on tiny inputs)")
+    args = parser.parse_args(argv)
+    progress.configure(level=progress.SILENT) # reporting is not part of what is measured
+    answers.disable() # and neither is reading cached answers
+
+    scaled_dir = args.scaled_dir or tempfile.mkdtemp(prefix="aoc-scaled-")
+    os.makedirs(scaled_dir, exist_ok=True)
+    jobs = []
+    for day in discover_days(args.days):
+        try:
+            parts = discover_parts(load_day(day))
+        except Exception as e:
+            print(f"{day:<36} ERROR {type(e).__name__}: {e}")
+            continue
+        for input_file_name in args.inputs or discover_inputs(day):
+            if os.path.exists(os.path.join(ROOT, day, input_file_name)):
+                jobs += [(day, part, input_file_name) for part in parts]
+        for scale in args.scale if day in GENERATORS else []:
+            # Absolute paths pass straight through the solvers' os.path.join with their own directory
+            path = write_input(day, os.path.join(scaled_dir, f"{day}_x{scale:g}_seed{args.seed}.txt"), scale=scale, seed=args.seed)
+            jobs += [(day, part, path) for part in parts]
+
+    results = {}
+    for job, result in run_benchmarks(jobs, args.warmup, args.repeat, args.max_time, args.timeout, args.workers):
+        results[job_key(job)] = result
+        print(format_result(job_key(job), result), flush=True)
+    results = dict(sorted(results.items()))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare, "r") as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
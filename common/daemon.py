@@ -0,0 +1,197 @@
+import argparse
+import collections
+import hashlib
+import json
+import os.path
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import inputs, progress
+from common.runner import discover_days, load_day, solve
+
+# A long-lived process that imports every day once and solves requests sent over a Unix domain socket, so repeated
+# solves skip interpreter startup and imports and find the days' caches (all bounded) and parsed inputs warm.
+#
+# The protocol is one JSON object per line in each direction. Requests are either
+#     {"day": "day11", "part": 2, "input": "/abs/path/to/input.txt"}    (input defaults to the day's input.txt)
+#     {"day": "day11", "part": 2, "data": "125 17"}                      (the input itself)
+# which are answered with the result of common.runner.solve (answer, error, wall and cpu), or one of the commands
+#     {"command": "ping"}, {"command": "stats"}, {"command": "shutdown"}.
+# Requests are handled one at a time, as the days keep state in module globals. Inputs sent as data are kept in a
+# private directory of at most AOC_DAEMON_DATA_SIZE bytes (default 64 MB), least recently used ones evicted first.
+
+
+DEFAULT_DATA_SIZE = 64 * 1024 * 1024
+
+
+def default_socket_path():
+    return os.environ.get("AOC_DAEMON_SOCKET", os.path.join(tempfile.gettempdir(), f"aoc-{os.getuid()}.sock"))
+
+
+def get_cache_stats(module):
+    # Sizes of the functools caches of a day's module-level functions
+    return {name: function.cache_info().currsize for name, function in vars(module).items() if hasattr(function, "cache_info")}
+
+
+class SolverDaemon(socketserver.UnixStreamServer):
+
+    def __init__(self, socket_path, days=None):
+        super().__init__(socket_path, SolverRequestHandler)
+        self.socket_path = socket_path
+        self.data_dir = tempfile.mkdtemp(prefix="aoc-daemon-")
+        self.data_files = collections.OrderedDict() # path -> size, least recently used first
+        self.max_data_size = int(os.environ.get("AOC_DAEMON_DATA_SIZE", DEFAULT_DATA_SIZE))
+        self.stopped = False
+        self.modules = {}
+        self.load_errors = {}
+        for day in discover_days(days):
+            try:
+                self.modules[day] = load_day(day)
+            except Exception as e:
+                self.load_errors[day] = f"{type(e).__name__}: {e}"
+
+    def server_bind(self):
+        # Solving reads arbitrary files, so only the owner may connect. The socket is created with these permissions
+        # rather than restricted after bind(), which would leave a window in which anyone could connect.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def get_data_file(self, data):
+        # Inputs sent as data are stored under their hash, so sending the same input again hits the parsed inputs
+        path = os.path.join(self.data_dir, hashlib.sha256(data).hexdigest() + ".txt")
+        if path in self.data_files:
+            self.data_files.move_to_end(path)
+            return path
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        self.data_files[path] = len(data)
+        self.evict_data_files()
+        return path
+
+    def evict_data_files(self):
+        # The file just stored is kept even if it alone exceeds the limit, as it is about to be solved
+        total = sum(self.data_files.values())
+        while total > self.max_data_size and len(self.data_files) > 1:
+            path, size = self.data_files.popitem(last=False)
+            os.remove(path)
+            total -= size
+
+    def handle_message(self, message):
+        command = message.get("command", "solve")
+        if command == "ping":
+            return {"ok": True, "days": sorted(self.modules.keys()), "load_errors": self.load_errors}
+        if command == "stats":
+            return {"caches": {day: get_cache_stats(module) for day, module in sorted(self.modules.items())}, "parsed_inputs": len(inputs.parsed_inputs), "data_files": len(self.data_files), "data_size": sum(self.data_files.values())}
+        if command == "shutdown":
+            self.stopped = True
+            return {"ok": True}
+        if command != "solve":
+            return {"error": f"Unknown command {command}"}
+        day = message.get("day")
+        if day not in self.modules:
+            return {"day": day, "error": self.load_errors.get(day, f"Unknown day {day}")}
+        if "data" in message:
+            input_file = self.get_data_file(message["data"].encode())
+        else:
+            input_file = os.path.abspath(message.get("input", os.path.join(os.path.dirname(self.modules[day].__file__), "input.txt")))
+        return solve(day, int(message.get("part", 1)), input_file)
+
+    def run(self):
+        while not self.stopped:
+            self.handle_request()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip() == b"":
+                continue
+            try:
+                response = self.server.handle_message(json.loads(line))
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode())
+            self.wfile.flush()
+            if self.server.stopped:
+                break
+
+
+def send(messages, socket_path=None):
+    # Client side: sends the messages over one connection and returns the responses
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path or default_socket_path())
+        with client.makefile("rwb") as stream:
+            responses = []
+            for message in messages:
+                stream.write((json.dumps(message) + "\n").encode())
+                stream.flush()
+                responses.append(json.loads(stream.readline()))
+            return responses
+
+
+def serve(socket_path, days=None):
+    if os.path.exists(socket_path):
+        try:
+            send([{"command": "ping"}], socket_path)
+            exit(f"A daemon is already listening on {socket_path}.")
+        except OSError:
+            os.remove(socket_path) # left behind by a daemon that did not shut down cleanly
+    progress.configure(level=progress.SILENT)
+    with SolverDaemon(socket_path, days) as daemon:
+        print(f"Serving {len(daemon.modules)} days on {socket_path}", file=sys.stderr)
+        for day, error in daemon.load_errors.items():
+            print(f"Could not load {day}: {error}", file=sys.stderr)
+        try:
+            daemon.run()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve days in a long-lived process with warm caches, over a Unix domain socket.")
+    parser.add_argument("--socket", default=None, help="path of the socket (default: $AOC_DAEMON_SOCKET or aoc-<uid>.sock in the temp directory)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="start the daemon")
+    serve_parser.add_argument("days", nargs="*", help="days to preload (default: all)")
+    solve_parser = commands.add_parser("solve", help="solve a part with the running daemon")
+    solve_parser.add_argument("day")
+    solve_parser.add_argument("part", type=int)
+    solve_parser.add_argument("input", nargs="?", default=None, help="input file (default: the day's input.txt)")
+    for command in ["ping", "stats", "shutdown"]:
+        commands.add_parser(command)
+    args = parser.parse_args(argv)
+    socket_path = args.socket or default_socket_path()
+
+    if args.command == "serve":
+        serve(socket_path, args.days)
+        return 0
+    if args.command == "solve":
+        message = {"day": args.day, "part": args.part}
+        if args.input is not None:
+            message["input"] = os.path.abspath(args.input)
+    else:
+        message = {"command": args.command}
+    response = send([message], socket_path)[0]
+    print(json.dumps(response, default=str))
+    return 1 if response.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,410 @@
+import argparse
+import math
+import os.path
+import random
+import sys
+
+# Synthetic puzzle inputs of arbitrary size. Every generator takes a seeded random.Random and a size in the unit
+# that naturally describes the day (number of lines, grid side length, number of bits, ...) and returns the input
+# as a string in the same format as the shipped input.txt (no trailing newline). BASE_SIZES holds the size of the
+# shipped inputs, so scaling by 10x, 100x, ... always refers to the amount of data, not to the size parameter:
+# for grid days the side length grows with the square root of the scale factor.
+
+
+def generate_day01(rng, n_lines):
+    return "\n".join(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}" for _ in range(n_lines))
+
+
+def generate_day02(rng, n_reports):
+    reports = []
+    for _ in range(n_reports):
+        direction = rng.choice([-1, 1])
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly safe steps with the occasional bad level, like the real reports
+            step = direction * rng.randint(1, 3) if rng.random() < 0.9 else rng.choice([0, -direction, direction * rng.randint(4, 7)])
+            levels.append(levels[-1] + step)
+        reports.append(" ".join(str(level) for level in levels))
+    return "\n".join(reports)
+
+
+def generate_day03(rng, n_chars):
+    tokens = ["do()", "don't()", "mul(4*", "mul(6,9!", "?(12,34)", "mul ( 2 , 4 )", "select()", "from()", "what()", "how()"]
+    junk = "!@#$%^&*()[]{}<>,;:'+-_/?~ "
+    memory = []
+    length = 0
+    while length < n_chars:
+        r = rng.random()
+        if r < 0.15:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif r < 0.25:
+            token = rng.choice(tokens)
+        else:
+            token = "".join(rng.choice(junk) for _ in range(rng.randint(1, 8)))
+        memory.append(token)
+        length += len(token)
+    memory = "".join(memory)[:n_chars]
+    return "\n".join(memory[k:k+3000] for k in range(0, len(memory), 3000))
+
+
+def generate_day04(rng, side):
+    return "\n".join("".join(rng.choice("XMAS") for _ in range(side)) for _ in range(side))
+
+
+def generate_day05(rng, n_updates):
+    # The page ordering rules list every pair of pages (like the real input), so they define a total order
+    pages = rng.sample(range(11, 100), 49)
+    rules = [f"{pages[i]}|{pages[j]}" for i in range(len(pages)) for j in range(i+1, len(pages))]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(n_updates):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(str(page) for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def generate_day06(rng, side):
+    map = [['#' if rng.random() < 0.015 else '.' for _ in range(side)] for _ in range(side)]
+    gi, gj = rng.randrange(side), rng.randrange(side)
+    map[gi][gj] = '^'
+    return "\n".join("".join(line) for line in map)
+
+
+def generate_day07(rng, n_equations):
+    equations = []
+    for _ in range(n_equations):
+        operands = [rng.randint(1, 999) if rng.random() < 0.5 else rng.randint(1, 9) for _ in range(rng.randint(3, 12))]
+        test_value = operands[0]
+        for operand in operands[1:]:
+            # Keep test values in the range of the real input (below 10^15)
+            test_value = rng.choice([value for value in [test_value * operand, int(str(test_value) + str(operand))] if value < 10**15] + [test_value + operand])
+        if rng.random() < 0.5:
+            test_value += rng.randint(1, 100) # most likely no longer solvable
+        equations.append(f"{test_value}: " + " ".join(str(operand) for operand in operands))
+    return "\n".join(equations)
+
+
+def generate_day08(rng, side):
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    map = [['.' for _ in range(side)] for _ in range(side)]
+    for _ in range(max(1, side*side//12)):
+        map[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return "\n".join("".join(line) for line in map)
+
+
+def generate_day09(rng, length):
+    length += 1 - length % 2 # files and free space alternate, starting and ending with a file
+    return "".join(str(rng.randint(1, 9) if k % 2 == 0 else rng.randint(0, 9)) for k in range(length))
+
+
+def generate_day10(rng, side):
+    # Heights descend from randomly placed peaks, so there are hiking trails from 0 to 9 all over the map
+    peaks = [(rng.randrange(side), rng.randrange(side)) for _ in range(max(1, side*side//60))]
+    map = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+    for (pi, pj) in peaks:
+        for i in range(max(0, pi-9), min(side, pi+10)):
+            for j in range(max(0, pj-9), min(side, pj+10)):
+                d = abs(i-pi) + abs(j-pj)
+                if d <= 9 and rng.random() < 0.9:
+                    map[i][j] = 9 - d
+    return "\n".join("".join(str(x) for x in line) for line in map)
+
+
+def generate_day11(rng, n_stones):
+    return " ".join(str(rng.choice([0, rng.randint(1, 99), rng.randint(100, 999999)])) for _ in range(n_stones))
+
+
+def generate_day12(rng, side):
+    # Copying the plant type from a neighbor most of the time grows irregular regions of the same plant
+    garden = [['' for _ in range(side)] for _ in range(side)]
+    for i in range(side):
+        for j in range(side):
+            r = rng.random()
+            if r < 0.45 and i > 0:
+                garden[i][j] = garden[i-1][j]
+            elif r < 0.9 and j > 0:
+                garden[i][j] = garden[i][j-1]
+            else:
+                garden[i][j] = chr(ord('A') + rng.randrange(26))
+    return "\n".join("".join(line) for line in garden)
+
+
+def generate_day13(rng, n_machines):
+    machines = []
+    for _ in range(n_machines):
+        a = (rng.randint(10, 99), rng.randint(10, 99))
+        b = (rng.randint(10, 99), rng.randint(10, 99))
+        if rng.random() < 0.5:
+            i, j = rng.randint(1, 100), rng.randint(1, 100)
+            prize = (i*a[0] + j*b[0], i*a[1] + j*b[1])
+        else:
+            prize = (rng.randint(1000, 20000), rng.randint(1000, 20000))
+        machines.append(f"Button A: X+{a[0]}, Y+{a[1]}\nButton B: X+{b[0]}, Y+{b[1]}\nPrize: X={prize[0]}, Y={prize[1]}")
+    return "\n\n".join(machines)
+
+
+def generate_day14(rng, n_robots):
+    # The solver assumes the 101 x 103 space of the real puzzle
+    return "\n".join(f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-100, 100)},{rng.randint(-100, 100)}" for _ in range(n_robots))
+
+
+def generate_day15(rng, side):
+    map = [['#' if i in [0, side-1] or j in [0, side-1] else rng.choices(['.', 'O', '#'], [0.55, 0.4, 0.05])[0] for j in range(side)] for i in range(side)]
+    map[side//2][side//2] = '@'
+    moves = "".join(rng.choice("<>^v") for _ in range(8*side*side))
+    return "\n".join("".join(line) for line in map) + "\n\n" + "\n".join(moves[k:k+1000] for k in range(0, len(moves), 1000))
+
+
+def generate_maze(rng, side, extra_openings):
+    # Randomized depth-first search on the odd cells gives a perfect maze; knocking out some additional walls
+    # adds loops, so that there are several best paths like in the real input
+    side += 1 - side % 2
+    maze = [['#' for _ in range(side)] for _ in range(side)]
+    maze[side-2][1] = '.'
+    stack = [(side-2, 1)]
+    while len(stack) > 0:
+        (i, j) = stack[-1]
+        candidates = [(i+di, j+dj) for (di, dj) in [(-2, 0), (2, 0), (0, -2), (0, 2)] if 0 < i+di < side-1 and 0 < j+dj < side-1 and maze[i+di][j+dj] == '#']
+        if len(candidates) == 0:
+            stack.pop()
+            continue
+        (ii, jj) = rng.choice(candidates)
+        maze[(i+ii)//2][(j+jj)//2] = '.'
+        maze[ii][jj] = '.'
+        stack.append((ii, jj))
+    for _ in range(int(extra_openings * side * side)):
+        i, j = rng.randrange(1, side-1), rng.randrange(1, side-1)
+        if (i % 2 == 1) != (j % 2 == 1):
+            maze[i][j] = '.'
+    return maze
+
+
+def generate_day16(rng, side):
+    maze = generate_maze(rng, side, 0.01)
+    maze[len(maze)-2][1] = 'S'
+    maze[1][len(maze)-2] = 'E'
+    return "\n".join("".join(line) for line in maze)
+
+
+def generate_day17(rng, n_digits):
+    # Same program structure as the real input (a loop that outputs one octal digit of A per iteration)
+    program = [2, 4, 1, rng.randrange(8), 7, 5, 0, 3, 4, 0, 1, rng.randrange(8), 5, 5, 3, 0]
+    reg_a = rng.randrange(8**(n_digits-1), 8**n_digits)
+    return f"Register A: {reg_a}\nRegister B: 0\nRegister C: 0\n\nProgram: " + ",".join(str(x) for x in program)
+
+
+def generate_day18(rng, n_bytes):
+    # The solver assumes the 71 x 71 memory space of the real puzzle, so there can be at most 71*71 - 2 bytes
+    positions = [(x, y) for x in range(71) for y in range(71) if (x, y) not in [(0, 0), (70, 70)]]
+    return "\n".join(f"{x},{y}" for (x, y) in rng.sample(positions, min(n_bytes, len(positions))))
+
+
+def generate_day19(rng, n_designs):
+    # Like the real inputs, one colour has no single-stripe towel and no towel starts with it followed by some other
+    # colour, and the impossible designs (about 40%) start with that pair, so they fail on their first stripes
+    colour, next_colour = rng.sample("wubrg", 2)
+    towels = ["".join(rng.choice("wubrg") for _ in range(rng.randint(2, 8))) for _ in range(450)]
+    patterns = sorted(set([other for other in "wubrg" if other != colour] + [towel for towel in towels if not towel.startswith(colour + next_colour)]))
+    designs = []
+    for _ in range(n_designs):
+        design = "" if rng.random() < 0.6 else colour + next_colour
+        while len(design) < rng.randint(40, 60):
+            design += rng.choice(patterns)
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs)
+
+
+def generate_day20(rng, side):
+    # A single track that winds through the grid row by row, separated by one-tile walls. The seed only matters
+    # through the size, as there is exactly one such track per side length.
+    side += 1 - side % 2
+    track = [['#' for _ in range(side)] for _ in range(side)]
+    for i in range(1, side-1, 2):
+        for j in range(1, side-1):
+            track[i][j] = '.'
+        if i+2 < side-1:
+            track[i+1][side-2 if (i//2) % 2 == 0 else 1] = '.'
+    track[1][1] = 'S'
+    track[side-2][side-2 if ((side-2)//2) % 2 == 0 else 1] = 'E'
+    return "\n".join("".join(line) for line in track)
+
+
+def generate_day21(rng, n_codes):
+    return "\n".join(f"{rng.randrange(1000):03d}A" for _ in range(n_codes))
+
+
+def generate_day22(rng, n_buyers):
+    return "\n".join(str(rng.randrange(1, 16777216)) for _ in range(n_buyers))
+
+
+def generate_day23(rng, n_connections):
+    # Computer names are two lowercase letters, so the network has at most 676 computers; one large LAN party
+    # (a clique of 13 computers) is planted in a random graph
+    names = ["".join(pair) for pair in rng.sample([a+b for a in "abcdefghijklmnopqrstuvwxyz" for b in "abcdefghijklmnopqrstuvwxyz"], 676)]
+    n_computers = min(676, max(16, 2 * n_connections // 13)) # about 13 connections per computer
+    names = names[:n_computers]
+    connections = set()
+    party = rng.sample(names, 13)
+    for i in range(len(party)):
+        for j in range(i+1, len(party)):
+            connections.add(tuple(sorted([party[i], party[j]])))
+    max_connections = n_computers * (n_computers-1) // 2
+    while len(connections) < min(n_connections, max_connections):
+        c1, c2 = rng.sample(names, 2)
+        connections.add(tuple(sorted([c1, c2])))
+    connections = [f"{c1}-{c2}" if rng.random() < 0.5 else f"{c2}-{c1}" for (c1, c2) in connections]
+    rng.shuffle(connections)
+    return "\n".join(connections)
+
+
+def generate_day24(rng, n_bits):
+    # A ripple carry adder of n_bits bits with four pairs of swapped gate outputs. The solver reads wire names as
+    # exactly three characters, so there can be at most 99 bits (z00 to z99).
+    n_bits = min(n_bits, 99)
+    used = set()
+
+    def new_wire():
+        while True:
+            name = "".join(rng.choice("abcdefghijklmnopqrstuvw") for _ in range(3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    gates = [["x00", "XOR", "y00", "z00"]]
+    carry = new_wire()
+    gates.append(["x00", "AND", "y00", carry])
+    for k in range(1, n_bits):
+        s, a, b = new_wire(), new_wire(), new_wire()
+        next_carry = f"z{n_bits:02d}" if k == n_bits-1 else new_wire()
+        gates += [[f"x{k:02d}", "XOR", f"y{k:02d}", s], [f"x{k:02d}", "AND", f"y{k:02d}", a], [s, "XOR", carry, f"z{k:02d}"], [s, "AND", carry, b], [a, "OR", b, next_carry]]
+        carry = next_carry
+
+    def acyclic(gates):
+        producers = {gate[3]: gate for gate in gates}
+        state = {}
+        for gate in gates:
+            stack = [(gate, 0)]
+            while len(stack) > 0:
+                (g, k) = stack.pop()
+                if k == 0:
+                    if state.get(g[3]) == 2:
+                        continue
+                    if state.get(g[3]) == 1:
+                        return False
+                    state[g[3]] = 1
+                    stack.append((g, 1))
+                    for wire in [g[0], g[2]]:
+                        if wire in producers and state.get(wire) != 2:
+                            if state.get(wire) == 1:
+                                return False
+                            stack.append((producers[wire], 0))
+                else:
+                    state[g[3]] = 2
+        return True
+
+    n_swaps = 0
+    while n_swaps < 4:
+        g1, g2 = rng.sample(gates[2:], 2)
+        g1[3], g2[3] = g2[3], g1[3]
+        if acyclic(gates):
+            n_swaps += 1
+        else:
+            g1[3], g2[3] = g2[3], g1[3]
+    rng.shuffle(gates)
+    values = [f"x{k:02d}: {rng.randint(0, 1)}" for k in range(n_bits)] + [f"y{k:02d}: {rng.randint(0, 1)}" for k in range(n_bits)]
+    return "\n".join(values) + "\n\n" + "\n".join(f"{i1} {type} {i2} -> {o}" for (i1, type, i2, o) in gates)
+
+
+def generate_day25(rng, n_schematics):
+    schematics = []
+    for _ in range(n_schematics):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        if rng.random() < 0.5: # lock: filled from the top
+            rows = ["".join('#' if i <= heights[j] else '.' for j in range(5)) for i in range(7)]
+        else: # key: filled from the bottom
+            rows = ["".join('#' if 6-i <= heights[j] else '.' for j in range(5)) for i in range(7)]
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics)
+
+
+GENERATORS = {
+    "day01": generate_day01,
+    "day02": generate_day02,
+    "day03": generate_day03,
+    "day04": generate_day04,
+    "day05": generate_day05,
+    "day06": generate_day06,
+    "day07": generate_day07,
+    "day08": generate_day08,
+    "day09": generate_day09,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day12": generate_day12,
+    "day13": generate_day13,
+    "day14": generate_day14,
+    "day15": generate_day15,
+    "day16": generate_day16,
+    "day17": generate_day17,
+    "day18": generate_day18,
+    "day19": generate_day19,
+    "day20": generate_day20,
+    "day21": generate_day21,
+    "day22": generate_day22,
+    "day23": generate_day23,
+    "day24": generate_day24,
+    "day25": generate_day25,
+}
+
+# Size of the shipped input.txt in the unit of each generator
+BASE_SIZES = {
+    "day01": 1000, "day02": 1000, "day03": 18000, "day04": 140, "day05": 194, "day06": 130, "day07": 850,
+    "day08": 50, "day09": 19999, "day10": 41, "day11": 8, "day12": 140, "day13": 320, "day14": 500, "day15": 50,
+    "day16": 141, "day17": 9, "day18": 3450, "day19": 400, "day20": 141, "day21": 5, "day22": 1585, "day23": 3380,
+    "day24": 45, "day25": 500,
+}
+
+# Days whose size is a grid side length; their amount of data grows with the square of the size
+GRID_DAYS = ["day04", "day06", "day08", "day10", "day12", "day15", "day16", "day20"]
+
+
+def scaled_size(day, scale):
+    if day in GRID_DAYS:
+        return max(3, round(BASE_SIZES[day] * math.sqrt(scale)))
+    return max(1, round(BASE_SIZES[day] * scale))
+
+
+def generate(day, size=None, scale=1, seed=0):
+    if size is None:
+        size = scaled_size(day, scale)
+    return GENERATORS[day](random.Random(f"{day}-{size}-{seed}"), size)
+
+
+def write_input(day, path, size=None, scale=1, seed=0):
+    with open(path, "w") as f:
+        f.write(generate(day, size, scale, seed))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic puzzle inputs of a given size.")
+    parser.add_argument("days", nargs="*", help="days to generate inputs for (default: all)")
+    parser.add_argument("--size", type=int, default=None, help="size in the natural unit of the day (lines, grid side, bits, ...)")
+    parser.add_argument("--scale", type=float, default=1, help="amount of data relative to the shipped input.txt")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out-dir", default=None, help="write dayNN_x<scale>_seed<seed>.txt files here instead of printing")
+    args = parser.parse_args(argv)
+
+    for day in args.days or sorted(GENERATORS.keys()):
+        if args.out_dir is None:
+            print(generate(day, args.size, args.scale, args.seed))
+            continue
+        os.makedirs(args.out_dir, exist_ok=True)
+        name = f"{day}_n{args.size}" if args.size is not None else f"{day}_x{args.scale:g}"
+        print(write_input(day, os.path.join(args.out_dir, f"{name}_seed{args.seed}.txt"), args.size, args.scale, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import numpy as np
+
+# Value of the cells around a map: never a character that appears in a puzzle, so a step off the map compares
+# unequal to every tile and needs no bounds check
+OUTSIDE = 0
+
+
+class Grid:
+    # A map stored as a single uint8 array of its characters, surrounded by `border` rows and columns of OUTSIDE.
+    # Cells are addressed by flat index k = (i + border) * stride + (j + border); moving to a neighbor is adding one
+    # of the offsets in N4 (up, right, down, left) or N8. `array` is the NumPy array for vectorized work, `cells` a
+    # memoryview of it for fast access to single cells in Python loops.
+
+    def __init__(self, array, height, width, border=1):
+        self.height = height
+        self.width = width
+        self.border = border
+        self.stride = width + 2*border
+        self.array = array
+        self.cells = memoryview(array)
+        s = self.stride
+        self.N4 = (-s, 1, s, -1)
+        self.N8 = (-s, -s+1, 1, s+1, s, s-1, -1, -s-1)
+
+    @classmethod
+    def blank(cls, height, width, fill='.', border=1):
+        array = np.full((height + 2*border, width + 2*border), OUTSIDE, dtype=np.uint8)
+        array[border:border+height, border:border+width] = ord(fill)
+        return cls(array.reshape(-1), height, width, border)
+
+    @classmethod
+    def from_lines(cls, lines, border=1):
+        lines = [line.rstrip('\n') for line in lines if line.strip('\n') != '']
+        grid = cls.blank(len(lines), len(lines[0]) if len(lines) > 0 else 0, border=border)
+        grid.rows()[:, :] = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(grid.height, grid.width)
+        return grid
+
+    @classmethod
+    def from_view(cls, view, border=1):
+        # Copies a GridView (rows of a MappedInput) into a bordered grid without going through Python strings
+        grid = cls.blank(view.height, view.width, border=border)
+        if grid.height > 0:
+            flat = np.frombuffer(view.view, dtype=np.uint8)
+            grid.rows()[:, :] = np.lib.stride_tricks.as_strided(flat, (view.height, view.width), (view.stride, 1))
+            del flat # release the view into the memory map before it is closed
+        return grid
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["cells"] # memoryviews cannot be pickled
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cells = memoryview(self.array)
+
+    def __getitem__(self, k):
+        return self.cells[k]
+
+    def __setitem__(self, k, value):
+        self.cells[k] = value
+
+    def __len__(self):
+        return len(self.array)
+
+    def __str__(self):
+        return "\n".join(row.tobytes().decode() for row in self.rows())
+
+    def copy(self):
+        return Grid(self.array.copy(), self.height, self.width, self.border)
+
+    def index(self, i, j):
+        return (i + self.border) * self.stride + j + self.border
+
+    def position(self, k):
+        i, j = divmod(k, self.stride)
+        return i - self.border, j - self.border
+
+    def rows(self):
+        # 2-D view of the map without its border
+        b = self.border
+        return self.array.reshape(-1, self.stride)[b:b+self.height, b:b+self.width]
+
+    def indices(self):
+        # Flat indices of all cells on the map, row by row
+        b = self.border
+        return (np.arange(b, b+self.height)[:, None] * self.stride + np.arange(b, b+self.width)[None, :]).reshape(-1)
+
+    def find(self, value):
+        # Flat indices of all cells holding value, row by row
+        return np.flatnonzero(self.array == ord(value))
+
+    def find_first(self, value):
+        found = self.find(value)
+        return int(found[0]) if len(found) > 0 else -1
+
+    def count(self, value):
+        return int(np.count_nonzero(self.array == ord(value)))
@@ -0,0 +1,204 @@
+import collections
+import functools
+import glob
+import hashlib
+import mmap
+import os.path
+import pickle
+import re
+import sys
+
+# Parsed puzzle inputs, shared by both parts of a day and by repeated runs in the same process. Entries are keyed
+# by the parser and the file's path, size and modification time, so an edited input is parsed again. Only the most
+# recently used MAX_PARSED_INPUTS are kept, so long-lived processes (batch workers, the daemon) stay bounded.
+parsed_inputs = collections.OrderedDict()
+MAX_PARSED_INPUTS = 64
+
+
+class MappedInput:
+    # Read-only memory map of an input file. Lines, grid rows and numbers are read straight from the mapped bytes,
+    # so large inputs are never materialized as a list of str. Views handed out by lines() and grid() point into the
+    # map and must be released (or copied) before the input is closed.
+
+    def __init__(self, input_file):
+        self.file = open(input_file, "rb")
+        if os.fstat(self.file.fileno()).st_size > 0:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.buffer = b"" # empty files cannot be mapped
+        self.view = memoryview(self.buffer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.file.close()
+
+    def lines(self):
+        # Yields every line as a memoryview without the line break
+        start = 0
+        while start < len(self.buffer):
+            end = self.buffer.find(b"\n", start)
+            if end == -1:
+                end = len(self.buffer)
+            yield self.view[start:end-1 if end > start and self.buffer[end-1] == 13 else end] # drop \r of \r\n
+            start = end + 1
+
+    def grid(self):
+        return GridView(self.view)
+
+    def ints(self, signed=False):
+        return extract_ints(self.buffer, signed)
+
+    def int_rows(self, signed=False):
+        return extract_int_rows(self.buffer, signed)
+
+
+class GridView:
+    # A rectangular map addressed in place: row i starts at i * stride, where stride = width + 1 skips the line break
+
+    def __init__(self, view):
+        self.view = view
+        newline = bytes(view[:4096]).find(b"\n") if len(view) > 0 else -1
+        self.width = newline if newline != -1 else len(view)
+        self.stride = self.width + 1
+        self.height = (len(view) + 1) // self.stride if self.width > 0 else 0
+
+    def __getitem__(self, position):
+        (i, j) = position
+        return self.view[i * self.stride + j]
+
+    def row(self, i):
+        return self.view[i * self.stride:i * self.stride + self.width]
+
+    def rows(self):
+        return [self.row(i) for i in range(self.height)]
+
+
+def extract_ints(buffer, signed=False):
+    # All (optionally signed) integers in a bytes-like object, e.g. a single line from MappedInput.lines()
+    return [int(x) for x in re.findall(rb"-?\d+" if signed else rb"\d+", buffer)]
+
+
+MAX_INT64_DIGITS = 18
+
+
+def extract_int_rows(buffer, signed=False):
+    # All integers of a whole input in one pass over its bytes with NumPy, as a ragged array: a flat int64 array of
+    # values and offsets such that the numbers on line k are values[offsets[k]:offsets[k+1]]. Lines are counted as in
+    # MappedInput.lines(), and with signed a "-" right before a number negates it, as in extract_ints.
+    import numpy as np # only the days parsing with this pay for importing NumPy
+    text = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(text == ord("\n"))
+    n_lines = len(newlines) + (len(text) > 0 and text[-1] != ord("\n"))
+    is_digit = (text - np.uint8(ord("0"))) <= 9
+    changes = np.empty(len(text) + 1, dtype=bool)
+    changes[[0, -1]] = is_digit[[0, -1]] if len(text) > 0 else False
+    np.not_equal(is_digit[1:], is_digit[:-1], out=changes[1:-1])
+    edges = np.flatnonzero(changes) # alternating starts and ends of numbers
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+    if len(starts) > 0 and lengths.max() > MAX_INT64_DIGITS:
+        raise ValueError(f"Numbers with more than {MAX_INT64_DIGITS} digits do not fit the int64 values")
+
+    # Digit by digit, over all numbers that are still that long, so the temporaries stay the size of the numbers
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(lengths.max() if len(starts) > 0 else 0):
+        if lengths.min() > k:
+            values *= 10
+            values += text.take(starts + k)
+            values -= ord("0")
+        else:
+            longer = np.flatnonzero(lengths > k)
+            values[longer] = values[longer] * 10 + text.take(starts[longer] + k) - ord("0")
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[starts > 0] = text[starts[starts > 0] - 1] == ord("-")
+        values[negative] *= -1
+
+    # Line k ends at the k-th line break, so its numbers end before the first number after that break
+    offsets = np.full(n_lines + 1, len(starts), dtype=np.int64) # a last line without a break ends with the input
+    offsets[0] = 0
+    offsets[1:len(newlines)+1] = np.searchsorted(starts, newlines)
+    return values, offsets
+
+
+def split_rows(values, offsets):
+    # The ragged array of extract_int_rows as a list of lists of ints, one per line
+    values, offsets = values.tolist(), offsets.tolist()
+    return [values[offsets[k]:offsets[k+1]] for k in range(len(offsets)-1)]
+
+
+def cache_dir():
+    # Parsed inputs are also pickled to disk if AOC_INPUT_CACHE points to a directory
+    return os.environ.get("AOC_INPUT_CACHE")
+
+
+@functools.cache
+def parser_version(module_name):
+    # Changing a day's code, or the common code its parsers build on (this module, Grid, ...), invalidates everything
+    # its parsers wrote to the disk cache
+    digest = hashlib.sha256()
+    for path in [sys.modules[module_name].__file__] + sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_from_disk(parse, input_file, mapped):
+    with MappedInput(input_file) as content:
+        digest = hashlib.sha256(f"{parse.__module__}.{parse.__qualname__}:{parser_version(parse.__module__)}:".encode())
+        digest.update(content.buffer)
+    path = os.path.join(cache_dir(), f"{digest.hexdigest()}.pickle")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    parsed = parse_file(parse, input_file, mapped)
+    os.makedirs(cache_dir(), exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    return parsed
+
+
+def parse_file(parse, input_file, mapped):
+    if mapped:
+        with MappedInput(input_file) as input:
+            return parse(input)
+    with open(input_file, "r") as f:
+        return parse(f.readlines())
+
+
+def parsed_input(parse=None, mapped=False):
+    # Turns parse(lines) into load(input_file_name="input.txt") that reads and parses every file only once.
+    # With mapped=True the parser gets a MappedInput instead of the list of lines; it must not keep any views
+    # into it. Both parts share the returned object, so parts must copy whatever they modify.
+    if parse is None:
+        return functools.partial(parsed_input, mapped=mapped)
+    day_dir = os.path.dirname(os.path.abspath(sys.modules[parse.__module__].__file__))
+
+    @functools.wraps(parse)
+    def load(input_file_name="input.txt"):
+        input_file = os.path.join(day_dir, input_file_name)
+        stat = os.stat(input_file)
+        key = (parse.__module__, parse.__qualname__, os.path.abspath(input_file), stat.st_size, stat.st_mtime_ns)
+        if key not in parsed_inputs:
+            if cache_dir():
+                parsed_inputs[key] = load_from_disk(parse, input_file, mapped)
+            else:
+                parsed_inputs[key] = parse_file(parse, input_file, mapped)
+            while len(parsed_inputs) > MAX_PARSED_INPUTS:
+                parsed_inputs.popitem(last=False)
+        parsed_inputs.move_to_end(key)
+        return parsed_inputs[key]
+
+    return load
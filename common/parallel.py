@@ -0,0 +1,33 @@
+import functools
+import operator
+import os
+
+# Map/reduce over independent records (reports, equations, machines, designs, buyers) on a process pool. The records
+# are split into chunks, each chunk is processed by a worker and the per-chunk results are combined in the order of
+# the chunks. Functions and their arguments are pickled to reach the workers, so they must be module-level functions
+# (or functools.partial of them), not lambdas or closures, and must not rely on module globals set by the caller.
+# With a single worker everything runs in the calling process, without a pool.
+
+
+def get_chunks(items, chunksize):
+    return [items[k:k+chunksize] for k in range(0, len(items), chunksize)]
+
+
+def map_reduce(process_chunk, items, combine=operator.add, initial=0, workers=1, chunksize=None):
+    # process_chunk(chunk) -> partial result; combine(total, partial) -> total. workers=None uses every core.
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        return combine(initial, process_chunk(items))
+    chunksize = chunksize or max(1, -(-len(items) // (4*workers))) # a few chunks per worker balances uneven records
+    import concurrent.futures # only imported once a pool is needed, as every solver goes through this module
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return functools.reduce(combine, executor.map(process_chunk, get_chunks(items, chunksize)), initial)
+
+
+def sum_chunk(function, chunk):
+    return sum([function(item) for item in chunk])
+
+
+def parallel_sum(function, items, workers=1, chunksize=None):
+    # sum(function(item) for item in items), with the items spread over workers
+    return map_reduce(functools.partial(sum_chunk, function), items, operator.add, 0, workers, chunksize)
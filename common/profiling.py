@@ -0,0 +1,131 @@
+import atexit
+import contextlib
+import functools
+import os
+import sys
+import time
+
+# Opt-in instrumentation of hot functions. Decorating a function with @hot records how often it is called and how
+# much time is spent in it, but only if AOC_PROFILE=1 was set when the day's module was imported (the runner sets it
+# for --profile). Otherwise hot returns the function itself, so normal runs pay nothing.
+#
+# Time spent in hot functions is also attributed to the stack of hot functions (and runner frames) it was called
+# from. write_collapsed() dumps these stacks in the collapsed format of flamegraph.pl / speedscope / inferno:
+#     day06.compute_part_2;day06.is_loop;day06.move_guard 1234567
+# one line per stack, with the self time in microseconds. Run on its own, a day prints its report to stderr on exit
+# and writes the stacks to AOC_PROFILE_OUTPUT if that is set.
+
+stats = {} # name -> [calls, cumulative seconds, self seconds]
+stacks = {} # "outer;...;inner" -> self seconds
+active = [] # frames of the currently running hot functions: [name, start, seconds spent in hot children]
+depth = {} # name -> number of active calls, so recursive calls do not count their time twice
+
+
+def enabled():
+    return os.environ.get("AOC_PROFILE", "0") not in ("", "0")
+
+
+def enable(output=None):
+    os.environ["AOC_PROFILE"] = "1"
+    if output is not None:
+        os.environ["AOC_PROFILE_OUTPUT"] = output
+
+
+def enter(name):
+    active.append([name, time.perf_counter(), 0.0])
+    depth[name] = depth.get(name, 0) + 1
+
+
+def leave():
+    name, start, children = active.pop()
+    elapsed = time.perf_counter() - start
+    depth[name] -= 1
+    entry = stats.setdefault(name, [0, 0.0, 0.0])
+    entry[0] += 1
+    entry[2] += elapsed - children
+    if depth[name] == 0:
+        entry[1] += elapsed
+    if len(active) > 0:
+        active[-1][2] += elapsed
+    stack = ";".join([outer[0] for outer in active] + [name])
+    stacks[stack] = stacks.get(stack, 0.0) + elapsed - children
+
+
+def get_name(function):
+    # day06.code.move_guard -> day06.move_guard
+    module = function.__module__[:-len(".code")] if function.__module__.endswith(".code") else function.__module__
+    return f"{module}.{function.__qualname__}"
+
+
+def hot(function):
+    if not enabled():
+        return function
+    name = get_name(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        enter(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            leave()
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def frame(name):
+    # Root frame for everything recorded while it is active, e.g. the part the runner is solving
+    if not enabled():
+        yield
+        return
+    enter(name)
+    try:
+        yield
+    finally:
+        leave()
+
+
+def snapshot(reset=True):
+    # Recorded stats and stacks, e.g. to send them from a worker process to the runner
+    result = {"stats": {name: list(entry) for name, entry in stats.items()}, "stacks": dict(stacks)}
+    if reset:
+        stats.clear()
+        stacks.clear()
+    return result
+
+
+def merge(total, other):
+    for name, entry in other["stats"].items():
+        merged = total["stats"].setdefault(name, [0, 0.0, 0.0])
+        for k in range(3):
+            merged[k] += entry[k]
+    for stack, seconds in other["stacks"].items():
+        total["stacks"][stack] = total["stacks"].get(stack, 0.0) + seconds
+    return total
+
+
+def format_report(profile):
+    lines = [f"{'function':<40} {'calls':>12} {'cumulative':>12} {'self':>12} {'per call':>12}"]
+    for name, (calls, cumulative, own) in sorted(profile["stats"].items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name:<40} {calls:>12} {cumulative:>11.3f}s {own:>11.3f}s {1e6*cumulative/calls:>10.2f}us")
+    return "\n".join(lines)
+
+
+def write_collapsed(profile, path):
+    with open(path, "w") as f:
+        for stack, seconds in sorted(profile["stacks"].items()):
+            f.write(f"{stack} {round(seconds * 1e6)}\n")
+
+
+def report_at_exit():
+    profile = snapshot()
+    if len(profile["stats"]) == 0:
+        return
+    print(format_report(profile), file=sys.stderr)
+    if os.environ.get("AOC_PROFILE_OUTPUT"):
+        write_collapsed(profile, os.environ["AOC_PROFILE_OUTPUT"])
+
+
+if enabled():
+    atexit.register(report_at_exit)
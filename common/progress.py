@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+
+# Progress reports and diagnostics of long-running loops. Everything goes to stderr, so answers on stdout stay
+# clean, and reports are rate limited so that a hot loop never waits for the terminal. The verbosity is read from
+# environment variables, so it also applies to worker processes started by the runner:
+#   AOC_PROGRESS           silent, info (default) or debug
+#   AOC_PROGRESS_INTERVAL  minimum number of seconds between two reports of the same loop (default 1)
+#   AOC_PROGRESS_BAR       1 to draw a single updating bar instead of printing one line per report
+
+SILENT = 0
+INFO = 1
+DEBUG = 2
+LEVELS = {"silent": SILENT, "info": INFO, "debug": DEBUG}
+
+
+def configure(level=None, interval=None, bar=None):
+    if level is not None:
+        os.environ["AOC_PROGRESS"] = level if isinstance(level, str) else [k for k, v in LEVELS.items() if v == level][0]
+    if interval is not None:
+        os.environ["AOC_PROGRESS_INTERVAL"] = str(interval)
+    if bar is not None:
+        os.environ["AOC_PROGRESS_BAR"] = "1" if bar else "0"
+
+
+def get_level():
+    level = os.environ.get("AOC_PROGRESS", "info").lower()
+    if level not in LEVELS:
+        exit(f"Unknown progress level {level}; use one of {', '.join(LEVELS.keys())}.")
+    return LEVELS[level]
+
+
+def enabled(level=INFO):
+    return get_level() >= level
+
+
+def log(message, level=INFO):
+    # One-off report; message may be a callable so that expensive messages are only built when shown
+    if enabled(level):
+        print(message() if callable(message) else message, file=sys.stderr, flush=True)
+
+
+class Progress:
+    # Counts iterations of a loop and reports them at most once per interval:
+    #     progress = Progress("Moving files", total=len(files))
+    #     for file in files:
+    #         ...
+    #         progress.update()
+    #     progress.close()
+    # In silent mode (or below the given level) update() returns right away.
+
+    def __init__(self, description, total=None, level=INFO, interval=None):
+        self.description = description
+        self.total = total
+        self.done = 0
+        self.disabled = not enabled(level)
+        self.interval = float(os.environ.get("AOC_PROGRESS_INTERVAL", 1)) if interval is None else interval
+        self.bar = os.environ.get("AOC_PROGRESS_BAR", "0") == "1"
+        self.start = time.monotonic()
+        self.last_report = self.start
+        self.reported = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def update(self, n=1, message=None):
+        if self.disabled:
+            return
+        self.done += n
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report(now, message)
+
+    def update_to(self, done, message=None):
+        self.update(done - self.done, message)
+
+    def close(self, message=None):
+        if self.disabled:
+            return
+        if self.reported:
+            self.report(time.monotonic(), message)
+            if self.bar:
+                print(file=sys.stderr, flush=True)
+        self.disabled = True
+
+    def report(self, now, message):
+        self.reported = True
+        rate = self.done / max(now - self.start, 1e-9)
+        if self.total:
+            fraction = min(self.done / self.total, 1)
+            status = f"{self.done}/{self.total} ({100*fraction:.1f}%)"
+            if self.bar:
+                status = f"[{'#' * int(30*fraction):<30}] {status}"
+        else:
+            status = f"{self.done}"
+        line = f"{self.description}: {status} {rate:.1f}/s"
+        if message is not None:
+            line += f" {message() if callable(message) else message}"
+        if self.bar:
+            print(f"\r{line}\x1b[K", end="", file=sys.stderr, flush=True)
+        else:
+            print(line, file=sys.stderr, flush=True)
@@ -0,0 +1,171 @@
+import argparse
+import contextlib
+import glob
+import importlib
+import os.path
+import re
+import resource
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from common import answers, profiling, progress
+
+
+def discover_days(days=None):
+    # day00 is the template every other day was started from, so it is skipped unless asked for
+    found = sorted(os.path.basename(os.path.dirname(path)) for path in glob.glob(os.path.join(ROOT, "day[0-9][0-9]", "code.py")))
+    if days:
+        return [day for day in found if day in days]
+    return [day for day in found if day != "day00"]
+
+
+def load_day(day):
+    return importlib.import_module(f"{day}.code")
+
+
+def discover_parts(module):
+    return sorted(int(m.group(1)) for m in (re.fullmatch(r"compute_part_(\d+)", name) for name in dir(module)) if m)
+
+
+def get_peak_rss():
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def solve(day, part, input_file_name="input.txt", memory=False):
+    # Runs in a worker process; the solvers' own print() output is dropped so only the report is shown. With memory
+    # the peak of the memory traced by tracemalloc while solving and the peak RSS of the worker are recorded as well.
+    result = {"day": day, "part": part, "input": input_file_name, "answer": None, "error": None}
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        module = load_day(day)
+        if memory:
+            tracemalloc.start()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), profiling.frame(f"{day}.compute_part_{part}"):
+            result["answer"] = getattr(module, f"compute_part_{part}")(input_file_name)
+    except BaseException as e: # exit() inside a solver raises SystemExit, which must not kill the worker
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["wall"] = time.perf_counter() - wall_start
+    result["cpu"] = time.process_time() - cpu_start
+    if memory:
+        result["traced"] = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        result["rss"] = get_peak_rss()
+        tracemalloc.stop()
+    if profiling.enabled():
+        result["profile"] = profiling.snapshot()
+    return result
+
+
+def collect_jobs(days, input_file_name="input.txt"):
+    jobs, errors = [], []
+    for day in days:
+        try:
+            module = load_day(day)
+        except Exception as e:
+            errors.append({"day": day, "part": None, "input": input_file_name, "answer": None, "error": f"{type(e).__name__}: {e}", "wall": 0.0, "cpu": 0.0})
+            continue
+        if not os.path.exists(os.path.join(ROOT, day, input_file_name)):
+            continue
+        for part in discover_parts(module):
+            jobs.append((day, part, input_file_name))
+    return jobs, errors
+
+
+def run_jobs(jobs, workers=None, memory=False):
+    # Every compute_part_* is an independent job, so slow parts only occupy one worker each. The peak RSS of a
+    # process cannot be reset, so to measure memory every job gets a fresh worker from a forkserver (a plain fork or
+    # spawn would start at the runner's own peak). The pool modules are only imported here, since the daemon and the
+    # batch solver import this module just for solve().
+    import concurrent.futures
+    import multiprocessing
+    pool = {"mp_context": multiprocessing.get_context("forkserver"), "max_tasks_per_child": 1} if memory else {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count(), **pool) as executor:
+        futures = [executor.submit(solve, *job, memory=memory) for job in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def parse_budgets(budgets):
+    # ["256", "day22=1024"] -> {None: 256 MB, "day22": 1024 MB}, where None is the default for all other days
+    parsed = {}
+    for budget in budgets:
+        day, _, megabytes = budget.rpartition("=")
+        try:
+            parsed[day or None] = float(megabytes) * 1024 * 1024
+        except ValueError:
+            exit(f"Invalid memory budget {budget}; expected MB or dayNN=MB.")
+    return parsed
+
+
+def check_budget(result, budgets):
+    budget = budgets.get(result["day"], budgets.get(None))
+    if budget is not None and result.get("traced", 0) > budget:
+        result["over_budget"] = budget
+    return result
+
+
+def format_result(result):
+    name = f"{result['day']} part {result['part']}" if result["part"] is not None else f"{result['day']}"
+    timing = f"wall {result['wall']:8.3f}s, cpu {result['cpu']:8.3f}s"
+    if "traced" in result:
+        timing += f", peak {result['traced'] / 2**20:8.1f}MB, rss {result['rss'] / 2**20:8.1f}MB"
+    if "over_budget" in result:
+        timing += f") (OVER BUDGET of {result['over_budget'] / 2**20:.1f}MB"
+    if result["error"] is not None:
+        return f"{name:<14} {'ERROR':<20} ({timing}) {result['error']}"
+    return f"{name:<14} {str(result['answer']):<20} ({timing})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve all days in parallel and report answers and timings.")
+    parser.add_argument("days", nargs="*", help="days to run, e.g. day06 day09 (default: all)")
+    parser.add_argument("--input", default="input.txt", help="input file name inside each day directory")
+    parser.add_argument("--workers", type=int, default=None, help="size of the process pool (default: number of cores)")
+    parser.add_argument("--progress", choices=progress.LEVELS.keys(), default="silent", help="progress reports of long-running parts on stderr (default: silent, as parts run in parallel)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="FILE", help="record the @hot functions of every day, print their call counts and times and write collapsed stacks for flamegraphs to FILE")
+    parser.add_argument("--memory", action="store_true", help="record the peak traced memory and peak RSS of every part (tracemalloc slows the solvers down)")
+    parser.add_argument("--memory-budget", action="append", default=[], metavar="[DAY=]MB", help="fail if the peak traced memory of a part exceeds this many MB, for all days or just DAY; implies --memory")
+    args = parser.parse_args(argv)
+    budgets = parse_budgets(args.memory_budget)
+    memory = args.memory or len(budgets) > 0
+    if memory:
+        answers.disable() # a cached answer would hide what solving takes
+    progress.configure(level=args.progress)
+    if args.profile is not None:
+        profiling.enable() # before the days are imported, as @hot decides when a function is defined
+
+    start = time.perf_counter()
+    jobs, results = collect_jobs(discover_days(args.days), args.input)
+    for result in results:
+        print(format_result(result), flush=True)
+    for result in run_jobs(jobs, args.workers, memory):
+        check_budget(result, budgets)
+        print(format_result(result), flush=True)
+        results.append(result)
+    print()
+    for result in sorted(results, key=lambda r: (r["day"], r["part"] or 0)):
+        print(format_result(result))
+    print(f"\nTotal: wall {time.perf_counter() - start:.3f}s, cpu {sum(r['cpu'] for r in results):.3f}s over {len(results)} parts")
+    over_budget = [r for r in results if "over_budget" in r]
+    if len(over_budget) > 0:
+        print(f"{len(over_budget)} parts exceeded their memory budget")
+    if args.profile is not None:
+        profile = {"stats": {}, "stacks": {}}
+        for result in results:
+            if "profile" in result:
+                profiling.merge(profile, result["profile"])
+        print()
+        print(profiling.format_report(profile))
+        if args.profile:
+            profiling.write_collapsed(profile, args.profile)
+            print(f"Collapsed stacks written to {args.profile}")
+    return 1 if any(r["error"] is not None for r in results) or len(over_budget) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import heapq
+from collections import deque
+
+# Shortest-path searches over states encoded as ints in range(n), e.g. flat Grid indices or 4*cell + direction.
+# Distances live in a preallocated list indexed by state, with UNREACHABLE for states that were never reached.
+# neighbors(u) yields the states one step away from u for bfs and (state, cost) pairs for the weighted searches.
+# source is a single state or an iterable of states that all start at distance 0.
+#
+# With predecessors=True the searches also return, for every reached state, the list of all states it is reached
+# from on some shortest path (None for unreached states). Together these form the DAG of all shortest paths, which
+# on_shortest_paths and shortest_paths walk backwards. If a target is given, the search stops as soon as that
+# target is settled; distances of states further away are then incomplete.
+
+UNREACHABLE = -1
+
+
+def get_sources(source):
+    return list(source) if hasattr(source, "__iter__") else [source]
+
+
+def get_result(dist, preds, predecessors):
+    return (dist, preds) if predecessors else dist
+
+
+def bfs(n, source, neighbors, target=None, predecessors=False):
+    dist = [UNREACHABLE] * n
+    preds = [None] * n if predecessors else None
+    queue = deque()
+    for s in get_sources(source):
+        dist[s] = 0
+        queue.append(s)
+        if predecessors:
+            preds[s] = []
+    while len(queue) > 0:
+        u = queue.popleft()
+        if u == target:
+            break
+        du = dist[u] + 1
+        for v in neighbors(u):
+            if dist[v] == UNREACHABLE:
+                dist[v] = du
+                queue.append(v)
+                if predecessors:
+                    preds[v] = [u]
+            elif predecessors and dist[v] == du:
+                preds[v].append(u)
+    return get_result(dist, preds, predecessors)
+
+
+def dial(n, source, neighbors, max_cost, target=None, predecessors=False):
+    # Dijkstra for small non-negative integer costs: a circular array of max_cost+1 buckets replaces the heap, since
+    # all tentative distances lie within max_cost of the one being settled. With max_cost=1 this is a 0-1 BFS.
+    dist = [UNREACHABLE] * n
+    preds = [None] * n if predecessors else None
+    buckets = [[] for _ in range(max_cost+1)]
+    pending = 0
+    for s in get_sources(source):
+        dist[s] = 0
+        buckets[0].append(s)
+        pending += 1
+        if predecessors:
+            preds[s] = []
+    d = 0
+    while pending > 0:
+        bucket = buckets[d % (max_cost+1)]
+        while len(bucket) > 0:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue # stale entry, u has been settled at a smaller distance
+            if u == target:
+                return get_result(dist, preds, predecessors)
+            for v, cost in neighbors(u):
+                dv = d + cost
+                if dist[v] == UNREACHABLE or dv < dist[v]:
+                    dist[v] = dv
+                    buckets[dv % (max_cost+1)].append(v)
+                    pending += 1
+                    if predecessors:
+                        preds[v] = [u]
+                elif predecessors and dv == dist[v]:
+                    preds[v].append(u)
+        d += 1
+    return get_result(dist, preds, predecessors)
+
+
+def dijkstra(n, source, neighbors, target=None, predecessors=False):
+    dist = [UNREACHABLE] * n
+    preds = [None] * n if predecessors else None
+    heap = []
+    for s in get_sources(source):
+        dist[s] = 0
+        heap.append((0, s))
+        if predecessors:
+            preds[s] = []
+    heapq.heapify(heap)
+    while len(heap) > 0:
+        d, u = heapq.heappop(heap)
+        if dist[u] != d:
+            continue
+        if u == target:
+            break
+        for v, cost in neighbors(u):
+            dv = d + cost
+            if dist[v] == UNREACHABLE or dv < dist[v]:
+                dist[v] = dv
+                heapq.heappush(heap, (dv, v))
+                if predecessors:
+                    preds[v] = [u]
+            elif predecessors and dv == dist[v]:
+                preds[v].append(u)
+    return get_result(dist, preds, predecessors)
+
+
+def astar(n, source, neighbors, heuristic, target):
+    # Distance from source to target, or UNREACHABLE. heuristic(u) must never overestimate the distance to target.
+    dist = [UNREACHABLE] * n
+    heap = []
+    for s in get_sources(source):
+        dist[s] = 0
+        heap.append((heuristic(s), 0, s))
+    heapq.heapify(heap)
+    while len(heap) > 0:
+        _, d, u = heapq.heappop(heap)
+        if dist[u] != d:
+            continue
+        if u == target:
+            return d
+        for v, cost in neighbors(u):
+            dv = d + cost
+            if dist[v] == UNREACHABLE or dv < dist[v]:
+                dist[v] = dv
+                heapq.heappush(heap, (dv + heuristic(v), dv, v))
+    return UNREACHABLE
+
+
+def on_shortest_paths(preds, targets):
+    # Marks every state that lies on some shortest path to one of the targets
+    marked = bytearray(len(preds))
+    queue = deque()
+    for t in get_sources(targets):
+        if preds[t] is not None and not marked[t]:
+            marked[t] = 1
+            queue.append(t)
+    while len(queue) > 0:
+        v = queue.popleft()
+        for u in preds[v]:
+            if not marked[u]:
+                marked[u] = 1
+                queue.append(u)
+    return marked
+
+
+def shortest_paths(preds, target):
+    # Yields every shortest path to target as the list of its states, starting at a source
+    if preds[target] is None:
+        return
+    if len(preds[target]) == 0:
+        yield [target]
+        return
+    for u in preds[target]:
+        for path in shortest_paths(preds, u):
+            yield path + [target]
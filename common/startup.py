@@ -0,0 +1,116 @@
+import argparse
+import json
+import os.path
+import platform
+import subprocess
+import sys
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.runner import ROOT, discover_days
+
+# Startup cost of every day and of the runner: the time `python -X importtime -c "import dayNN.code"` reports for
+# importing the module, everything it imports included, in a fresh interpreter. The batch solver and the daemon pay
+# it once, but running a day on its own (or a runner worker on spawn) pays it on every call, so heavy imports belong
+# in the function that needs them rather than at the top of a module every solve goes through.
+
+RUNNER_MODULES = ["common.runner"]
+
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" lines, nested imports indented below their parent but
+    # printed before it, as an import is only done once everything it imports is
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(own), int(cumulative)))
+    return entries
+
+
+def get_children(entries, module):
+    # Direct imports of module, with their cumulative times
+    for k, (name, depth, _, _) in enumerate(entries):
+        if name == module:
+            break
+    else:
+        return []
+    children = []
+    for name, child_depth, _, cumulative in reversed(entries[:k]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((name, cumulative))
+    return children
+
+
+def measure(module, repeat):
+    # Fastest of repeat fresh interpreters, as only the noise of the machine makes an import slower
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT, capture_output=True, text=True)
+        if process.returncode != 0:
+            return {"error": process.stderr.strip().splitlines()[-1] if process.stderr.strip() else f"exit code {process.returncode}"}
+        entries = parse_importtime(process.stderr)
+        total = sum([cumulative for name, _, _, cumulative in entries if name == module])
+        if best is None or total < best[0]:
+            best = (total, entries)
+    total, entries = best
+    heaviest = sorted(get_children(entries, module), key=lambda child: -child[1])
+    return {"import": total / 1e6, "heaviest": [[name, cumulative / 1e6] for name, cumulative in heaviest[:3]]}
+
+
+def compare(results, baseline, threshold, min_delta=0.005):
+    regressions = []
+    for module, result in results.items():
+        old = baseline.get("results", {}).get(module)
+        if old is None or "error" in result or "error" in old:
+            continue
+        if result["import"] > old["import"] * (1 + threshold) and result["import"] - old["import"] > min_delta:
+            regressions.append(f"{module}: import {1000*old['import']:.1f}ms -> {1000*result['import']:.1f}ms ({result['import']/old['import']-1:+.0%})")
+    return regressions
+
+
+def format_result(module, result):
+    if "error" in result:
+        return f"{module:<16} ERROR {result['error']}"
+    heaviest = ", ".join(f"{name} {1000*seconds:.1f}ms" for name, seconds in result["heaviest"])
+    return f"{module:<16} import {1000*result['import']:7.1f}ms  ({heaviest})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how long importing every day and the runner takes in a fresh interpreter.")
+    parser.add_argument("days", nargs="*", help="days to measure (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module, of which the fastest counts")
+    parser.add_argument("--budget", type=float, default=None, metavar="MS", help="fail if importing a module takes longer than this many milliseconds")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a JSON baseline written by --save")
+    parser.add_argument("--threshold", type=float, default=0.5, help="relative slowdown that counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns smaller than this many seconds (noise of interpreter startup)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in [f"{day}.code" for day in discover_days(args.days)] + RUNNER_MODULES:
+        results[module] = measure(module, args.repeat)
+        print(format_result(module, results[module]), flush=True)
+
+    failures = [f"{module}: {result['error']}" for module, result in results.items() if "error" in result]
+    if args.budget is not None:
+        failures += [f"{module}: import {1000*result['import']:.1f}ms over the budget of {args.budget:g}ms" for module, result in results.items() if "error" not in result and 1000*result["import"] > args.budget]
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare, "r") as f:
+            failures += compare(results, json.load(f), args.threshold, args.min_delta)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
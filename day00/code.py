@@ -1,12 +1,10 @@
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
 
 
 class Dummy:
@@ -18,14 +16,21 @@ class Dummy:
             pass
 
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+@parsed_input
+def load_input(input):
     numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
+    return numbers
+
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt"):
+    numbers = load_input(input_file_name)
     return 0
 
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+    numbers = load_input(input_file_name)
     return 0
 
 
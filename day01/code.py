@@ -1,12 +1,12 @@
+import bisect
 import os.path
-import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import extract_int_rows, parsed_input
 
 # --- Day 1: Historian Hysteria ---
 # The Chief Historian is always present for the big Christmas sleigh launch, 
@@ -85,13 +85,118 @@ def read_input(input_file_name):
 # Your actual left and right lists contain many location IDs. What is the 
 # total distance between your lists?
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    left = sorted([pair[0] for pair in numbers])
-    right = sorted([pair[1] for pair in numbers])
-    differences = [abs(left[i]-right[i]) for i in range(len(input))]
-    return sum(differences)
+def get_columns(numbers):
+    # left and right column alternate
+    return numbers[0::2].copy(), numbers[1::2].copy()
+
+@parsed_input(mapped=True)
+def load_input(input):
+    numbers, _ = input.int_rows()
+    return get_columns(numbers)
+
+# External-memory mode, for lists larger than the memory: the input is read buffer_size bytes at a time, every chunk
+# is sorted and spilled to a run file per column, and the runs are k-way merged into the two sorted columns, of which
+# only a block per run is in memory at once. At most MAX_MERGE_RUNS runs per column are merged at once; more runs are
+# first merged in groups into longer runs, pass after pass, so open files and read blocks stay bounded.
+MAX_MERGE_RUNS = 64 # both columns are merged side by side, so up to twice as many run files are open
+MIN_BLOCK_SIZE = 1 << 10 # numbers read from a run at a time, however small the buffer
+
+def get_input_file(input_file_name):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), input_file_name)
+
+def read_columns(input_file, buffer_size):
+    # Yields the left and right numbers of every chunk, cut after the last complete line
+    with open(input_file, "rb") as f:
+        rest = b""
+        for block in iter(lambda: f.read(buffer_size), b""):
+            lines, _, rest = (rest + block).rpartition(b"\n")
+            if len(lines) > 0:
+                yield get_columns(extract_int_rows(lines)[0])
+        if len(rest) > 0:
+            yield get_columns(extract_int_rows(rest)[0])
+
+def spill_sorted_runs(input_file, buffer_size, directory):
+    runs = ([], [])
+    for k, columns in enumerate(read_columns(input_file, buffer_size)):
+        for column, numbers in enumerate(columns):
+            path = os.path.join(directory, f"run{k}_{column}.bin")
+            np.sort(numbers).tofile(path)
+            runs[column].append(path)
+    return runs
+
+def read_run(path, block_size):
+    with open(path, "rb") as f:
+        while True:
+            block = np.fromfile(f, dtype=np.int64, count=block_size)
+            if len(block) == 0:
+                return
+            yield from block.tolist()
+
+def write_run(numbers, path, block_size):
+    import itertools # the modules of the external-memory mode are only imported when it is used
+    with open(path, "wb") as f:
+        while True:
+            block = np.fromiter(itertools.islice(numbers, block_size), dtype=np.int64)
+            if len(block) == 0:
+                return
+            block.tofile(f)
+
+def merge_runs(paths, buffer_size):
+    import heapq
+    block_size = max(MIN_BLOCK_SIZE, buffer_size // (8 * 2 * MAX_MERGE_RUNS)) # 8 bytes per number
+    level = 0
+    while len(paths) > MAX_MERGE_RUNS:
+        merged = []
+        for k in range(0, len(paths), MAX_MERGE_RUNS):
+            group = paths[k:k+MAX_MERGE_RUNS]
+            path = f"{group[0][:-len('.bin')]}_{level}.bin"
+            write_run(heapq.merge(*[read_run(run, block_size) for run in group]), path, block_size)
+            for run in group:
+                os.remove(run)
+            merged.append(path)
+        paths = merged
+        level += 1
+    return heapq.merge(*[read_run(path, block_size) for path in paths])
+
+def get_run_lengths(numbers):
+    # (number, count) for a sorted stream of numbers
+    import itertools
+    for number, group in itertools.groupby(numbers):
+        yield number, sum(1 for _ in group)
+
+def external_total_distance(input_file, buffer_size):
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix="aoc-day01-") as directory:
+        left, right = spill_sorted_runs(input_file, buffer_size, directory)
+        return sum(abs(a-b) for a, b in zip(merge_runs(left, buffer_size), merge_runs(right, buffer_size)))
+
+def external_similarity_score(input_file, buffer_size):
+    # Merge join of the run lengths of both sorted columns: a number seen a times on the left and b times on the
+    # right adds number * a * b
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix="aoc-day01-") as directory:
+        left, right = spill_sorted_runs(input_file, buffer_size, directory)
+        right_runs = get_run_lengths(merge_runs(right, buffer_size))
+        right_number, right_count = next(right_runs, (None, 0))
+        score = 0
+        for number, count in get_run_lengths(merge_runs(left, buffer_size)):
+            while right_number is not None and right_number < number:
+                right_number, right_count = next(right_runs, (None, 0))
+            if right_number == number:
+                score += number * count * right_count
+        return score
+
+def total_distance(left, right):
+    # The i-th smallest numbers of both lists are paired up
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", buffer_size=None):
+    # With a buffer_size (in bytes) the lists are sorted in external memory instead
+    if buffer_size is not None:
+        return external_total_distance(get_input_file(input_file_name), buffer_size)
+    left, right = load_input(input_file_name)
+    return total_distance(left, right)
 
 # 1646452
 # That's the right answer! You are one gold star closer to finding the 
@@ -143,19 +248,89 @@ def compute_part_1(input_file_name="input.txt"):
 # Once again consider your left and right lists. What is their similarity 
 # score?
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    left = [pair[0] for pair in numbers]
-    right = [pair[1] for pair in numbers]
-    similarities = [number * right.count(number) for number in left]
-    return sum(similarities)
+# Location IDs spanning a range of at most COUNTING_FACTOR times the list length (or MIN_COUNTING_RANGE) are counted
+# in a plain histogram over that range; wider spread IDs are counted by sorting, so the histogram stays small
+COUNTING_FACTOR = 4
+MIN_COUNTING_RANGE = 1 << 16
+
+def similarity_score(left, right):
+    # Every number on the left times how often it appears on the right, with one counting pass over the right list
+    if len(right) == 0:
+        return 0
+    lowest = right.min()
+    if right.max() - lowest < max(COUNTING_FACTOR * len(right), MIN_COUNTING_RANGE):
+        counts = np.bincount(right - lowest)
+        shifted = left - lowest
+        counted = (shifted >= 0) & (shifted < len(counts))
+        return int((left[counted] * counts[shifted[counted]]).sum())
+    numbers, counts = np.unique(right, return_counts=True)
+    positions = np.minimum(np.searchsorted(numbers, left), len(numbers)-1)
+    found = numbers[positions] == left
+    return int((left[found] * counts[positions[found]]).sum())
+
+@cached_answer
+def compute_part_2(input_file_name="input.txt", buffer_size=None):
+    if buffer_size is not None:
+        return external_similarity_score(get_input_file(input_file_name), buffer_size)
+    left, right = load_input(input_file_name)
+    return similarity_score(left, right)
 
 # 23609874
 # That's the right answer! You are one gold star closer to finding the Chief 
 # Historian.
 
+class Reconciler:
+    # Keeps the total distance and the similarity score of two lists up to date while pairs are added and removed.
+    # Both columns are kept sorted and their numbers counted. Inserting a number at rank i on the left and one at
+    # rank j on the right only re-pairs the ranks between min(i, j) and max(i, j), as all ranks below keep their
+    # pairs and all above move up together; the similarity only changes by the added or removed numbers' terms.
+
+    def __init__(self, left=(), right=()):
+        if len(left) != len(right):
+            raise ValueError(f"Lists of different lengths {len(left)} and {len(right)}")
+        self.left = sorted(left)
+        self.right = sorted(right)
+        self.left_counts = {}
+        self.right_counts = {}
+        for number in self.left:
+            self.left_counts[number] = self.left_counts.get(number, 0) + 1
+        for number in self.right:
+            self.right_counts[number] = self.right_counts.get(number, 0) + 1
+        self.distance = self.get_distance(0, len(self.left))
+        self.similarity = sum([number * count * self.right_counts.get(number, 0) for number, count in self.left_counts.items()])
+
+    def __len__(self):
+        return len(self.left)
+
+    def get_distance(self, start, stop):
+        return sum([abs(self.left[k] - self.right[k]) for k in range(start, stop)])
+
+    def add(self, left, right):
+        i = bisect.bisect_right(self.left, left)
+        j = bisect.bisect_right(self.right, right)
+        self.distance -= self.get_distance(min(i, j), max(i, j))
+        self.left.insert(i, left)
+        self.right.insert(j, right)
+        self.distance += self.get_distance(min(i, j), max(i, j) + 1)
+        self.similarity += left * self.right_counts.get(left, 0)
+        self.left_counts[left] = self.left_counts.get(left, 0) + 1
+        self.similarity += right * self.left_counts.get(right, 0)
+        self.right_counts[right] = self.right_counts.get(right, 0) + 1
+
+    def remove(self, left, right):
+        if self.left_counts.get(left, 0) == 0 or self.right_counts.get(right, 0) == 0:
+            raise ValueError(f"Pair ({left}, {right}) is not in the lists")
+        i = bisect.bisect_left(self.left, left)
+        j = bisect.bisect_left(self.right, right)
+        self.distance -= self.get_distance(min(i, j), max(i, j) + 1)
+        del self.left[i]
+        del self.right[j]
+        self.distance += self.get_distance(min(i, j), max(i, j))
+        self.right_counts[right] -= 1
+        self.similarity -= right * self.left_counts.get(right, 0)
+        self.left_counts[left] -= 1
+        self.similarity -= left * self.right_counts.get(left, 0)
+
 if __name__ == "__main__":
     print(f"PART 1: {compute_part_1()}")
     print(f"PART 2: {compute_part_2()}")
@@ -1,12 +1,15 @@
+import collections
+import functools
 import os.path
 import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import extract_ints, parsed_input, split_rows
+from common.parallel import map_reduce, parallel_sum
 
 
 class Dummy:
@@ -68,21 +71,65 @@ class Dummy:
 
 # Analyze the unusual data from the engineers. How many reports are safe?
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    reports = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    return sum([check_report(report) for report in reports])
-
-def check_report(report):
-    diffs = [report[i+1] - report[i] for i in range(len(report)-1)]
-    if not (all(diff > 0 for diff in diffs) or all(diff < 0 for diff in diffs)):
-        # print(f"{report} not strictly increasing/decreasing")
-        return 0
-    if any((abs(diff) > 3) for diff in diffs):
-        # print(f"{report} diff too big")
-        return 0
-    # print(f"{report} safe")
-    return 1
+class Reports:
+    # All reports in one padded 2-D array: row k holds the lengths[k] levels of report k, followed by zeros. Slicing
+    # selects reports, so chunks of them can be handed to workers.
+    def __init__(self, levels, lengths):
+        self.levels = levels
+        self.lengths = lengths
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __getitem__(self, key):
+        return Reports(self.levels[key], self.lengths[key])
+
+    @staticmethod
+    def from_rows(values, offsets):
+        lengths = np.diff(offsets)
+        width = lengths.max() if len(lengths) > 0 else 0
+        levels = np.zeros((len(lengths), width), dtype=values.dtype)
+        levels[np.arange(width) < lengths[:, None]] = values # the mask is filled row by row, like the values
+        return Reports(levels, lengths)
+
+
+@parsed_input(mapped=True)
+def load_input(input):
+    return split_rows(*input.int_rows())
+
+
+@parsed_input(mapped=True)
+def load_reports(input):
+    return Reports.from_rows(*input.int_rows())
+
+
+def classify_reports(levels, lengths):
+    # Safe flag of every report: the differences between its levels are either all 1 to 3 or all -3 to -1
+    diffs = levels[:, 1:] - levels[:, :-1]
+    padding = np.arange(diffs.shape[1]) >= (lengths - 1)[:, None]
+    increasing = ((diffs >= 1) & (diffs <= 3) | padding).all(axis=1)
+    decreasing = ((diffs <= -1) & (diffs >= -3) | padding).all(axis=1)
+    return increasing | decreasing
+
+
+def classify_reports_dampened(levels, lengths):
+    # Safe flag of every report with at most one level removed, trying the removal of every column for all reports
+    # at once; removing a column beyond a report's end leaves it as it is
+    safe = classify_reports(levels, lengths)
+    for r in range(levels.shape[1]):
+        safe |= classify_reports(np.delete(levels, r, axis=1), lengths - (r < lengths))
+    return safe
+
+
+def count_safe_reports(reports, dampened=False):
+    safe = (classify_reports_dampened if dampened else classify_reports)(reports.levels, reports.lengths)
+    return int(np.count_nonzero(safe))
+
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", workers=1):
+    reports = load_reports(input_file_name)
+    return map_reduce(count_safe_reports, reports, workers=workers)
 
 # Your puzzle answer was 213.
 
@@ -111,10 +158,82 @@ def check_report(report):
 # Update your analysis by handling situations where the Problem Dampener can 
 # remove a single level from unsafe reports. How many reports are now safe?
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    reports = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    return sum([any([check_report(report[:i] + report[i + 1:]) for i in range(len(report))]) for report in reports]) 
+def find_violation(report, direction, skipped, start=-1):
+    # First two consecutive levels (ignoring the skipped ones) that do not differ by 1 to 3 in the given direction,
+    # along with the level kept before them, scanning on from the kept level at start. None if there is none.
+    before, previous = -1, start
+    for q in range(start + 1, len(report)):
+        if q in skipped:
+            continue
+        if previous >= 0 and not 1 <= (report[q] - report[previous]) * direction <= 3:
+            return before, previous, q
+        before, previous = previous, q
+    return None
+
+
+def can_be_safe(report, direction, tolerance, skipped=(), start=-1):
+    # Levels p and q of the first violation stay neighbours whatever else is removed, so one of them has to go. The
+    # levels up to the one before p were fine and stay fine, so the scan resumes there.
+    violation = find_violation(report, direction, skipped, start)
+    if violation is None:
+        return True
+    if tolerance == 0:
+        return False
+    before, p, q = violation
+    return can_be_safe(report, direction, tolerance-1, skipped + (p,), before) or can_be_safe(report, direction, tolerance-1, skipped + (q,), before)
+
+
+def check_report_dampened(report, tolerance=1):
+    # Safe if removing at most tolerance levels makes it strictly increasing or decreasing in steps of 1 to 3
+    return int(can_be_safe(report, 1, tolerance) or can_be_safe(report, -1, tolerance))
+
+
+@cached_answer(keyed=["tolerance"])
+def compute_part_2(input_file_name="input.txt", workers=1, tolerance=1):
+    if tolerance <= 1:
+        return map_reduce(functools.partial(count_safe_reports, dampened=tolerance == 1), load_reports(input_file_name), workers=workers)
+    # Removing more levels is checked report by report
+    reports = load_input(input_file_name)
+    return parallel_sum(functools.partial(check_report_dampened, tolerance=tolerance), reports, workers)
+
+# Reasons a report is unsafe, reported with the index of the level that breaks it
+DIRECTION = "direction" # the level reverses the direction set by the first two levels
+TOO_BIG = "too_big" # the level differs from the previous one by more than 3
+ZERO = "zero" # the level equals the previous one
+
+ReportStatus = collections.namedtuple("ReportStatus", ["index", "safe", "safe_dampened", "n_safe", "n_safe_dampened", "reason", "level"])
+
+
+def diagnose_report(report):
+    # (reason, index of the offending level) for the first level that makes the report unsafe, or (None, None)
+    direction = 0
+    for i in range(1, len(report)):
+        diff = report[i] - report[i-1]
+        if diff == 0:
+            return ZERO, i
+        if direction == 0:
+            direction = 1 if diff > 0 else -1
+        elif diff * direction < 0:
+            return DIRECTION, i
+        if abs(diff) > 3:
+            return TOO_BIG, i
+    return None, None
+
+
+def validate_reports(lines):
+    # Validates reports from any iterable of lines (e.g. an open file or a socket's makefile()), one at a time, and
+    # yields a ReportStatus per report with the running counts of safe reports under both rules. Only the current
+    # report is held in memory. Blank lines are skipped.
+    n_safe, n_safe_dampened = 0, 0
+    for k, line in enumerate(line for line in lines if line.strip()):
+        report = extract_ints(line.encode() if isinstance(line, str) else line)
+        reason, level = diagnose_report(report)
+        safe = reason is None
+        safe_dampened = safe or check_report_dampened(report) == 1
+        n_safe += safe
+        n_safe_dampened += safe_dampened
+        yield ReportStatus(k, safe, safe_dampened, n_safe, n_safe_dampened, reason, level)
+
 
 # 285
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,12 +1,12 @@
+import functools
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import MappedInput
+from common.parallel import map_reduce
     
 
 # --- Day 3: Mull It Over ---
@@ -41,16 +41,121 @@ def read_input(input_file_name):
 # Scan the corrupted memory for uncorrupted mul instructions. What do you get if you 
 # add up all of the results of the multiplications?
 
-def eval_multiplication(mul):
-    numbers = [int(x) for x in re.findall(r"\d{1,3}", mul)]
-    if len(numbers) != 2:
-        exit(f"Issue: Found more numbers than expected in mul {mul}: {numbers}")
-    return numbers[0] * numbers[1]
-
-def compute_part_1(input_file_name="input.txt"):
-    input = "".join(read_input(input_file_name)).replace('\n', ' ')
-    multiplications = [x for x in re.findall(r"mul\(\d{1,3}\,\d{1,3}\)", input)]
-    return sum([eval_multiplication(mul) for mul in multiplications])
+INSTRUCTIONS = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+
+MAX_INSTRUCTION_LENGTH = len(b"mul(999,999)")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+def scan(buffer, enabled=True):
+    # One pass over all instructions, tracking whether mul is enabled: (sum of all products, sum of enabled products,
+    # whether mul is enabled at the end, end of the last instruction)
+    total, enabled_total = 0, 0
+    end = 0
+    for match in INSTRUCTIONS.finditer(buffer):
+        end = match.end()
+        if match.lastindex is not None: # mul(X,Y) is the only instruction with groups
+            product = int(match.group(1)) * int(match.group(2))
+            total += product
+            if enabled:
+                enabled_total += product
+        else:
+            enabled = match.end() - match.start() == len(b"do()")
+    return total, enabled_total, enabled, end
+
+def scan_stream(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Scans a file object chunk by chunk, so memory stays bounded by the chunk size. An instruction cut off at the
+    # end of a chunk starts within its last MAX_INSTRUCTION_LENGTH-1 bytes, which are carried over to the next chunk
+    # unless an instruction already ended there; so is whether mul is enabled.
+    total, enabled_total = 0, 0
+    enabled = True
+    tail = b""
+    while True:
+        block = file.read(chunk_size)
+        if not block:
+            break
+        buffer = tail + (block.encode() if isinstance(block, str) else block) # text streams such as sys.stdin
+        chunk_total, chunk_enabled_total, enabled, end = scan(buffer, enabled)
+        total += chunk_total
+        enabled_total += chunk_enabled_total
+        tail = buffer[max(end, len(buffer) - MAX_INSTRUCTION_LENGTH + 1):]
+    return total, enabled_total
+
+def get_input_file(input_file_name):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), input_file_name)
+
+def scan_file(input_file_name, chunk_size):
+    with open(get_input_file(input_file_name), "rb") as f:
+        return scan_stream(f, chunk_size)
+
+# Parallel mode: the input is split into segments that are scanned independently. Whether mul is enabled at the
+# start of a segment is only known once all segments before it are scanned, so a segment is summarized as
+#     (sum of all products, sum of products before its first do()/don't(), sum of enabled products after it,
+#      whether mul is enabled after its last do()/don't(), or None if it has none)
+# which does not depend on that, and the summaries are stitched together in order.
+EMPTY_SEGMENT = (0, 0, 0, None)
+
+def scan_segment(buffer, start, stop):
+    # Instructions starting in [start, stop); one cut off at stop is read to its end, which is at most
+    # MAX_INSTRUCTION_LENGTH-1 bytes further. No instruction contains the start of another one, so starting the
+    # scan in the middle of an instruction of the previous segment finds nothing that is not there.
+    total, before, after = 0, 0, 0
+    enabled = None
+    for match in INSTRUCTIONS.finditer(buffer, start, min(len(buffer), stop + MAX_INSTRUCTION_LENGTH - 1)):
+        if match.start() >= stop:
+            break
+        if match.lastindex is not None:
+            product = int(match.group(1)) * int(match.group(2))
+            total += product
+            if enabled is None:
+                before += product
+            elif enabled:
+                after += product
+        else:
+            enabled = match.end() - match.start() == len(b"do()")
+    return total, before, after, enabled
+
+def stitch_segments(first, second):
+    # Summary of two consecutive segments; stitching is associative, so runs of segments can be stitched in workers
+    total, before, after, enabled = first
+    if enabled is None: # the first segment passes on whatever state it started with
+        return total + second[0], before + second[1], second[2], second[3]
+    after += (second[1] if enabled else 0) + second[2]
+    return total + second[0], before, after, enabled if second[3] is None else second[3]
+
+def scan_segments(input_file, segments):
+    # Runs in a worker, which maps the input itself instead of receiving its bytes
+    with MappedInput(input_file) as input:
+        return functools.reduce(stitch_segments, [scan_segment(input.buffer, start, stop) for start, stop in segments], EMPTY_SEGMENT)
+
+def scan_parallel(input_file_name, workers=None, n_segments=None):
+    input_file = get_input_file(input_file_name)
+    size = os.path.getsize(input_file)
+    n_segments = n_segments or 4 * (workers or os.cpu_count())
+    bounds = [size * k // n_segments for k in range(n_segments + 1)]
+    segments = [(bounds[k], bounds[k+1]) for k in range(n_segments) if bounds[k] < bounds[k+1]]
+    total, before, after, _ = map_reduce(functools.partial(scan_segments, input_file), segments, stitch_segments, EMPTY_SEGMENT, workers)
+    return total, before + after # mul is enabled at the start
+
+def get_sums(input_file_name, chunk_size=None, workers=1):
+    if workers != 1:
+        return scan_parallel(input_file_name, workers)
+    if chunk_size is not None:
+        return scan_file(input_file_name, chunk_size)
+    return scan_mapped(input_file_name)
+
+def scan_mapped(input_file_name):
+    # None of the instructions span a line break, so the mapped bytes are scanned as they are. Not a parsed_input:
+    # that would cache the answers themselves rather than the input.
+    with MappedInput(get_input_file(input_file_name)) as input:
+        total, enabled_total, _, _ = scan(input.buffer)
+    return total, enabled_total
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", chunk_size=None, workers=1):
+    # With a chunk_size (in bytes) the input is streamed rather than mapped, e.g. for dumps of many gigabytes, and
+    # with more than one worker (None for all cores) segments of it are scanned in parallel
+    total, _ = get_sums(input_file_name, chunk_size, workers)
+    return total
 
 # 170068701
 
@@ -84,11 +189,10 @@ def compute_part_1(input_file_name="input.txt"):
 # Handle the new instructions; what do you get if you add up all of the 
 # results of just the enabled multiplications?
 
-def compute_part_2(input_file_name="input.txt"):
-    input = "".join(read_input(input_file_name)).replace('\n', ' ')
-    do_input = [x for x in re.findall(r"do\(\)(.*?)don\'t\(\)", "do()" + input + "don't()")] # need the ? for lazy fetch and () for not matching the do()/don't()
-    multiplications = [[x for x in re.findall(r"mul\(\d{1,3}\,\d{1,3}\)", line)] for line in do_input]
-    return sum([sum([eval_multiplication(mul) for mul in line]) for line in multiplications])
+@cached_answer
+def compute_part_2(input_file_name="input.txt", chunk_size=None, workers=1):
+    _, enabled_total = get_sums(input_file_name, chunk_size, workers)
+    return enabled_total
 
 # 78683433
 
@@ -1,11 +1,10 @@
 import os.path
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import Grid
+from common.inputs import parsed_input
 
 
 # --- Day 4: Ceres Search ---
@@ -58,24 +57,23 @@ def read_input(input_file_name):
 
 # Take a look at the little Elf's word search. How many times does XMAS appear?
 
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid(), border=3) # a word starting at the edge reaches 3 cells past it
+
+def count_word(grid, word, offset):
+    # Number of cells where word starts and continues in the direction of offset, checked for all cells at once
+    cells = grid.indices()
+    found = grid.array[cells] == ord(word[0])
+    for k in range(1, len(word)):
+        found &= grid.array[cells + k*offset] == ord(word[k])
+    return int(found.sum())
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    input = [line.replace("\n", "") for line in input]
-    n = len(input[0]) # width
-    m = len(input) # height
-    horizontal = ["".join(line) for line in input]
-    vertical = ["".join([line[i] for line in input]) for i in range(m)]
-    diagonal_1 = ["".join([input[k-i][i] for i in range(k+1)]) for k in range(0, m)] \
-        + ["".join([input[m-i-1][n-k+i-1] for i in range(k+1)]) for k in range(0, m-1)]
-    diagonal_2 = ["".join([input[m-i-1][k-i] for i in range(k+1)]) for k in range(0, m)] \
-        + ["".join([input[k-i][n-i-1] for i in range(k+1)]) for k in range(0, m-1)]
-    all = horizontal + vertical + diagonal_1 + diagonal_2
-    # print(f"Horizontal: {horizontal}")
-    # print(f"Vertical: {vertical}")
-    # print(f"Diagonal_1: {diagonal_1}")
-    # print(f"Diagonal_2: {diagonal_2}")
-    # print(f"All: {all}")
-    return sum([line.count("XMAS") + line.count("SAMX") for line in all])
+    grid = load_input(input_file_name)
+    # Looking for XMAS in all 8 directions also covers SAMX (XMAS backwards)
+    return sum([count_word(grid, "XMAS", offset) for offset in grid.N8])
 
 # 2567
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -116,13 +114,18 @@ def compute_part_1(input_file_name="input.txt"):
 # Flip the word search from the instructions back over to the word search 
 # side and try again. How many times does an X-MAS appear?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    input = [line.replace("\n", "") for line in input]
-    n = len(input[0]) # width
-    m = len(input) # height
-    crosses = [(["".join([input[i][j], input[i+1][j+1], input[i+2][j+2], input[i+2][j], input[i+1][j+1], input[i][j+2]]) for i in range(n-2)]) for j in range(m-2)]
-    return sum([cross.count("MASMAS") + cross.count("MASSAM") + cross.count("SAMMAS") + cross.count("SAMSAM") for cross in crosses])
+    grid = load_input(input_file_name)
+    a = grid.array
+    s = grid.stride
+    cells = grid.indices()
+    # Both diagonals through an A have to read MAS in either direction, i.e. hold one M and one S
+    ms = ord('M') + ord('S')
+    crosses = (a[cells] == ord('A')) \
+        & (a[cells-s-1].astype(int) + a[cells+s+1] == ms) & ((a[cells-s-1] == ord('M')) | (a[cells-s-1] == ord('S'))) \
+        & (a[cells-s+1].astype(int) + a[cells+s-1] == ms) & ((a[cells-s+1] == ord('M')) | (a[cells-s+1] == ord('S')))
+    return int(crosses.sum())
 
 # 2029
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,13 +1,11 @@
 import os.path
 import re
+import sys
 from functools import cmp_to_key
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
 
 
 class Dummy:
@@ -134,10 +132,15 @@ class Dummy:
 # if you add up the middle page number from those correctly-ordered updates?
 
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+@parsed_input
+def load_input(input):
     rules = [[int(x[0]), int(x[1])] for x in re.findall(r"(\d+)\|(\d+)", "".join(input))]
     updates = [[int(x.replace('\n', '')) for x in line.split(',')] for line in input if ',' in line]
+    return rules, updates
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt"):
+    rules, updates = load_input(input_file_name)
     def compare(a, b):
         for rule in rules:
             if rule[0] == a and rule[1] == b:
@@ -170,10 +173,9 @@ def compute_part_1(input_file_name="input.txt"):
 # Find the updates which are not in the correct order. What do you get if you 
 # add up the middle page numbers after correctly ordering just those updates?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    rules = [[int(x[0]), int(x[1])] for x in re.findall(r"(\d+)\|(\d+)", "".join(input))]
-    updates = [[int(x.replace('\n', '')) for x in line.split(',')] for line in input if ',' in line]
+    rules, updates = load_input(input_file_name)
     def compare(a, b):
         for rule in rules:
             if rule[0] == a and rule[1] == b:
@@ -1,12 +1,12 @@
 import os.path
-import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import OUTSIDE, Grid
+from common.inputs import parsed_input
+from common.profiling import hot
+from common.progress import Progress
 
 
 # --- Day 6: Guard Gallivant ---
@@ -121,76 +121,39 @@ def read_input(input_file_name):
 
 # Predict the path of the guard. How many distinct positions will the guard visit before leaving the mapped area?
 
-def get_guard_position(map):
-    for i in range(len(map)):
-        for j in range(len(map[0])):
-            if map[i][j] in ['^', '>', 'v', '>']:
-                return i, j
-
-def move_guard(map, guard_i, guard_j):
-    match map[guard_i][guard_j]:
-        case '^':
-            if guard_i > 0:
-                if map[guard_i-1][guard_j] != '#': # move
-                    map[guard_i][guard_j] = 'X'
-                    map[guard_i-1][guard_j] = '^'
-                    return True, map, guard_i-1, guard_j
-                else: # turn
-                    map[guard_i][guard_j] = '>'
-                    return move_guard(map, guard_i, guard_j)
-            else:
-                return False, map, guard_i-1, guard_j # done
-        case '>':
-            if guard_j < len(map[guard_i])-1:
-                if map[guard_i][guard_j+1] != '#': # move
-                    map[guard_i][guard_j] = 'X'
-                    map[guard_i][guard_j+1] = '>'
-                    return True, map, guard_i, guard_j+1
-                else: # turn
-                    map[guard_i][guard_j] = 'v'
-                    return move_guard(map, guard_i, guard_j)
-            else:
-                return False, map, guard_i, guard_j+1 # done
-        case 'v':
-            if guard_i < len(map)-1:
-                if map[guard_i+1][guard_j] != '#': # move
-                    map[guard_i][guard_j] = 'X'
-                    map[guard_i+1][guard_j] = 'v'
-                    return True, map, guard_i+1, guard_j
-                else: # turn
-                    map[guard_i][guard_j] = '<'
-                    return move_guard(map, guard_i, guard_j)
-            else:
-                return False, map, guard_i+1, guard_j # done
-        case '<':
-            if guard_j > 0:
-                if map[guard_i][guard_j-1] != '#': # move
-                    map[guard_i][guard_j] = 'X'
-                    map[guard_i][guard_j-1] = '<'
-                    return True, map, guard_i, guard_j-1
-                else: # turn
-                    map[guard_i][guard_j] = '^'
-                    return move_guard(map, guard_i, guard_j)
-            else:
-                return False, map, guard_i, guard_j-1 # done
-        case _:
-            exit(f"Unexpected guard {map[guard_i][guard_j]}")
-
-def count_visited_positions(map):
-    count = 0
-    for line in map:
-        for pos in line:
-            count += pos in ['X', '^', '>', 'v', '>']
-    return count
+GUARDS = ['^', '>', 'v', '<'] # facing up, right, down and left, the same order as Grid.N4
+OBSTACLE = ord('#')
+EMPTY = ord('.')
 
+def get_guard_position(map):
+    for dir in range(len(GUARDS)):
+        k = map.find_first(GUARDS[dir])
+        if k != -1:
+            return k, dir
+
+@hot
+def move_guard(map, k, dir):
+    # Turn right until there is nothing directly in front, then take a step; outside the map the cell is OUTSIDE
+    while map.cells[k + map.N4[dir]] == OBSTACLE:
+        dir = (dir + 1) % 4
+    return k + map.N4[dir], dir
+
+def get_visited_positions(map, k, dir):
+    visited = bytearray(len(map))
+    while map.cells[k] != OUTSIDE:
+        visited[k] = 1
+        k, dir = move_guard(map, k, dir)
+    return visited
+
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid())
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    guard_i, guard_j = get_guard_position(map)
-    go_on = True
-    while go_on:
-        go_on, map, guard_i, guard_j = move_guard(map, guard_i, guard_j)
-    return count_visited_positions(map)
+    map = load_input(input_file_name)
+    guard, dir = get_guard_position(map)
+    return sum(get_visited_positions(map, guard, dir))
 
 # 5162
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -320,28 +283,34 @@ def compute_part_1(input_file_name="input.txt"):
 # Insight 1: Iff there's a loop in the map, the guard will still be moving after >n*m steps (visited every field at least once)
 # Insight 2: There are at most n*m possible positions for adding another obstacle
 # => This gives us a trivial n^2*m^2 algorithm, which should be good enough 
-
+# Insight 3: An obstacle can only change the guard's route if it is placed somewhere on that route
+# Insight 4: Instead of waiting for n*m steps, the guard is in a loop as soon as she is at the same position 
+#            facing the same direction a second time
+
+def is_loop(map, k, dir):
+    seen = bytearray(len(map)) # one bit per direction
+    while map.cells[k] != OUTSIDE:
+        if seen[k] & (1 << dir):
+            return True
+        seen[k] |= 1 << dir
+        k, dir = move_guard(map, k, dir)
+    return False
+
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    n = len(map)
-    m = len(map[0])
-    guard_i, guard_j = get_guard_position(map)
+    map = load_input(input_file_name).copy() # obstacles are added temporarily
+    guard, dir = get_guard_position(map)
+    route = get_visited_positions(map, guard, dir) # Insight 3
+    candidates = [k for k in range(len(map)) if route[k] and map.cells[k] == EMPTY]
     n_possible_obstacle_locations = 0
-    for i in range(n):
-        for j in range(m):
-            print(f"i = {i}, j = {j} (of {n*m})")
-            map = [[x for x in line.replace('\n', '')] for line in input] # reset map
-            guard_i, guard_j = get_guard_position(map)
-            if map[i][j] == '.':
-                map[i][j] = '#' # temporarily add obstacle
-                go_on = True
-                step_count = 0
-                while go_on and (step_count <= n*m):
-                    go_on, map, guard_i, guard_j = move_guard(map, guard_i, guard_j)
-                    step_count += 1
-                if step_count > n*m: # Insight 2
-                    n_possible_obstacle_locations += 1     
+    progress = Progress("Trying obstacles", total=len(candidates))
+    for k in candidates:
+        map.cells[k] = OBSTACLE # temporarily add obstacle
+        if is_loop(map, guard, dir): # Insight 4
+            n_possible_obstacle_locations += 1
+        map.cells[k] = EMPTY
+        progress.update(message=lambda: "at (i, j) = {}".format(map.position(k)))
+    progress.close()
     return n_possible_obstacle_locations
 
 # 1909
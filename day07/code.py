@@ -1,12 +1,11 @@
+import functools
 import os.path
-import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input, split_rows
+from common.parallel import parallel_sum
 
 
 # --- Day 7: Bridge Repair ---
@@ -74,11 +73,18 @@ def recursive_check(current_value, operands, test_value):
     else:
         return current_value == test_value
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    equations = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
+@parsed_input(mapped=True)
+def load_input(input):
+    return split_rows(*input.int_rows())
+
+def get_calibration_result(equation, check):
     # equations are of the form (test value, operand 1, ..., operand n)
-    return sum([equation[0] if recursive_check(equation[1], equation[2:], equation[0]) else 0 for equation in equations])
+    return equation[0] if check(equation[1], equation[2:], equation[0]) else 0
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", workers=1):
+    equations = load_input(input_file_name)
+    return parallel_sum(functools.partial(get_calibration_result, check=recursive_check), equations, workers)
 
 # 303766880536
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -119,10 +125,10 @@ def recursive_check_extended(current_value, operands, test_value):
     else:
         return current_value == test_value
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    equations = [[int(x) for x in re.findall(r"\d+", line)] for line in input]
-    return sum([equation[0] if recursive_check_extended(equation[1], equation[2:], equation[0]) else 0 for equation in equations])
+@cached_answer
+def compute_part_2(input_file_name="input.txt", workers=1):
+    equations = load_input(input_file_name)
+    return parallel_sum(functools.partial(get_calibration_result, check=recursive_check_extended), equations, workers)
 
 # 337041851384440
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,12 +1,13 @@
 import os.path
 import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import OUTSIDE, Grid
+from common.inputs import parsed_input
 
 
 class Dummy:
@@ -124,10 +125,8 @@ class Dummy:
 
 def collect_antenna_positions(map):
     antennas = {}
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] != '.':
-                antennas[map[i][j]] = antennas[map[i][j]] + [(i, j)] if map[i][j] in antennas.keys() else [(i, j)]
+    for k in np.flatnonzero((map.array != ord('.')) & (map.array != OUTSIDE)):
+        antennas.setdefault(chr(map.cells[k]), []).append(map.position(int(k)))
     return antennas
 
 def get_antinodes_on_map(same_frequency_antennas):
@@ -147,18 +146,25 @@ def get_antinodes_on_map(same_frequency_antennas):
     return antinodes
             
 
+def count_unique_on_map(antinodes, map_height, map_width):
+    antinodes = np.array(antinodes, dtype=np.int64).reshape(-1, 2)
+    antinodes = antinodes[(antinodes[:, 0] >= 0) & (antinodes[:, 0] < map_height) & (antinodes[:, 1] >= 0) & (antinodes[:, 1] < map_width)]
+    return len(np.unique(antinodes[:, 0] * map_width + antinodes[:, 1]))
+
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid())
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    map_height = len(map)
-    map_width = len(map[0])
+    map = load_input(input_file_name)
+    map_height = map.height
+    map_width = map.width
     antennas = collect_antenna_positions(map)
     antinodes = []
     for frequency in antennas.keys():
-        for antinode in get_antinodes_on_map(antennas[frequency]):
-            if antinode[0] >= 0 and antinode[0] < map_height and antinode[1] >= 0 and antinode[1] < map_width and antinode not in antinodes:
-                antinodes.append(antinode)
-    return len(antinodes)
+        antinodes += get_antinodes_on_map(antennas[frequency])
+    return count_unique_on_map(antinodes, map_height, map_width)
 
 # 426
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -229,18 +235,16 @@ def get_more_antinodes_on_map(same_frequency_antennas, max):
                 antinodes.append(an2)
     return antinodes
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    map_height = len(map)
-    map_width = len(map[0])
+    map = load_input(input_file_name)
+    map_height = map.height
+    map_width = map.width
     antennas = collect_antenna_positions(map)
     antinodes = []
     for frequency in antennas.keys():
-        for antinode in get_more_antinodes_on_map(antennas[frequency], max(map_height, map_width)):
-            if antinode[0] >= 0 and antinode[0] < map_height and antinode[1] >= 0 and antinode[1] < map_width and antinode not in antinodes:
-                antinodes.append(antinode)
-    return len(antinodes)
+        antinodes += get_more_antinodes_on_map(antennas[frequency], max(map_height, map_width))
+    return count_unique_on_map(antinodes, map_height, map_width)
 
 
 # 1359
@@ -1,12 +1,10 @@
 import os.path
-import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.progress import Progress
 
 
 # --- Day 9: Disk Fragmenter ---
@@ -116,11 +114,15 @@ def move_blocks(blocks):
             blocks[head], blocks[tail] = blocks[tail], blocks[head]
 
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+@parsed_input
+def load_input(input):
     if len(input) != 1:
         exit(f"Input formatting issues; should be of length 1 but is {len(input)}.")
-    disk_map = [int(x) for x in input[0]]
+    return [int(x) for x in input[0]]
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt"):
+    disk_map = load_input(input_file_name)
     blocks = make_blocks(disk_map)
     move_blocks(blocks)
     return sum([i*blocks[i] if blocks[i] >= 0 else 0 for i in range(len(blocks))])
@@ -163,6 +165,7 @@ def compute_part_1(input_file_name="input.txt"):
 def move_files(blocks):
     tail = len(blocks) - 1
     visited_files = []
+    progress = Progress("Moving Blocks as Files", total=len(blocks))
     while tail >= 0:
         file_id = blocks[tail]
         if file_id in visited_files:
@@ -182,14 +185,13 @@ def move_files(blocks):
                 break
             head += 1
         tail -= 1
-        print(f"Moving Blocks as Files {len(blocks)-tail}/{len(blocks)}")
+        progress.update_to(len(blocks)-1-tail)
+    progress.close()
 
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    if len(input) != 1:
-        exit(f"Input formatting issues; should be of length 1 but is {len(input)}.")
-    disk_map = [int(x) for x in input[0]]
+    disk_map = load_input(input_file_name)
     blocks = make_blocks(disk_map)
     move_files(blocks)
     return sum([i*blocks[i] if blocks[i] >= 0 else 0 for i in range(len(blocks))])
@@ -1,12 +1,11 @@
 import os.path
-import re
+import sys
+from collections import deque
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import Grid
+from common.inputs import parsed_input
 
 
 # --- Day 10: Hoof It ---
@@ -102,31 +101,39 @@ def read_input(input_file_name):
 # The reindeer gleefully carries over a protractor and adds it to the pile. 
 # What is the sum of the scores of all trailheads on your topographic map?
 
-def check_neighbor(i, j, ii, jj, map):
-    return ii >= 0 and ii < len(map) and jj >= 0 and jj < len(map[i]) and map[ii][jj] == map[i][j]+1
+# Heights are kept as the digit characters '0' to '9'. Neither '.' + 1 nor the border can ever equal a height + 1,
+# so impassable tiles and the edge of the map need no special checks.
+SUMMIT = ord('9')
+
+def check_neighbor(k, kk, map):
+    return map[kk] == map[k]+1
 
-def compute_trailhead_score(i0, j0, map):
+def compute_trailhead_score(k0, map):
+    # A trail only ever touches a few cells of the map, so visited is a set rather than an array the size of the map
     trailhead_score = 0
-    queue = []
-    visited = []
-    queue.append((i0,j0))
+    queue = deque()
+    visited = set()
+    queue.append(k0)
     while len(queue) > 0:
-        (i, j) = queue.pop(0)
-        if (i, j) in visited:
+        k = queue.popleft()
+        if k in visited:
             continue
-        visited.append((i, j))
-        if map[i][j] == 9:
+        visited.add(k)
+        if map[k] == SUMMIT:
             trailhead_score += 1
-        for (ii, jj) in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]:
-            if check_neighbor(i, j, ii, jj, map):
-                # print(f"{map[ii][jj]} at ({ii},{jj}) is reachable")
-                queue.append((ii,jj))
+        for d in map.N4:
+            if check_neighbor(k, k+d, map):
+                queue.append(k+d)
     return trailhead_score
         
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid())
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[int(x) for x in re.findall(r"\d", line)] for line in input]
-    trailhead_scores = [sum([compute_trailhead_score(i, j, map) if map[i][j] == 0 else 0 for j in range(len(map[i]))]) for i in range(len(map))]
+    map = load_input(input_file_name)
+    trailhead_scores = [compute_trailhead_score(int(k), map) for k in map.find('0')]
     return sum(trailhead_scores)
 
 # 535
@@ -201,28 +208,28 @@ def compute_part_1(input_file_name="input.txt"):
 # out of toothpicks and bits of paper and is using them to mark trailheads on 
 # your topographic map. What is the sum of the ratings of all trailheads?
 
-def compute_updated_trailhead_score(i0, j0, map):
+def compute_updated_trailhead_score(k0, map):
     # No need for visited here as we count different paths and the map is acyclic
     trailhead_score = 0
-    queue = []
-    queue.append((i0,j0))
+    queue = deque()
+    queue.append(k0)
     while len(queue) > 0:
-        (i, j) = queue.pop(0)
-        if map[i][j] == 9:
+        k = queue.popleft()
+        if map[k] == SUMMIT:
             trailhead_score += 1
-        for (ii, jj) in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]:
-            if check_neighbor(i, j, ii, jj, map):
-                queue.append((ii,jj))
+        for d in map.N4:
+            if check_neighbor(k, k+d, map):
+                queue.append(k+d)
     return trailhead_score
 
 # 1186
 # That's the right answer! You are one gold star closer to finding the Chief 
 # Historian.
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[int(x) for x in re.findall(r"\d", line)] for line in input]
-    trailhead_scores = [sum([compute_updated_trailhead_score(i, j, map) if map[i][j] == 0 else 0 for j in range(len(map[i]))]) for i in range(len(map))]
+    map = load_input(input_file_name)
+    trailhead_scores = [compute_updated_trailhead_score(int(k), map) for k in map.find('0')]
     return sum(trailhead_scores)
 
 
@@ -1,13 +1,10 @@
-import os.path
-import re
 import functools
+import os.path
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
 
 
 # --- Day 11: Plutonian Pebbles ---
@@ -86,7 +83,12 @@ def read_input(input_file_name):
 # Consider the arrangement of stones in front of you. How many stones will 
 # you have after blinking 25 times?
 
-@functools.lru_cache(maxsize=None)
+# Bounded so that a long-lived process solving many inputs does not grow without limit; a single input needs about
+# 4k blinks and 130k counts
+BLINK_CACHE_SIZE = 1 << 14
+COUNT_CACHE_SIZE = 1 << 18
+
+@functools.lru_cache(maxsize=BLINK_CACHE_SIZE)
 def single_blink(stone):
     if stone == 0:
         return (1, None)
@@ -96,7 +98,7 @@ def single_blink(stone):
         return(int(str_stone[0:len_stone//2]), int(str_stone[len_stone//2:]))
     return (stone * 2024, None)
 
-@functools.lru_cache(maxsize=None)
+@functools.lru_cache(maxsize=COUNT_CACHE_SIZE)
 def count_stone_after_n_blinks(stone, n):
     if stone is None:
         return 0
@@ -105,9 +107,13 @@ def count_stone_after_n_blinks(stone, n):
         return 1 if right == None else 2
     return count_stone_after_n_blinks(left, n-1) + count_stone_after_n_blinks(right, n-1)
 
+@parsed_input(mapped=True)
+def load_input(input):
+    return input.ints()
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    stones = [int(x) for x in re.findall(r"\d+", "".join(input))]
+    stones = load_input(input_file_name)
     n = 25
     return sum([count_stone_after_n_blinks(stone, n) for stone in stones])
 
@@ -122,9 +128,9 @@ def compute_part_1(input_file_name="input.txt"):
 
 # How many stones would you have after blinking a total of 75 times?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    stones = [int(x) for x in re.findall(r"\d+", "".join(input))]
+    stones = load_input(input_file_name)
     n = 75
     return sum([count_stone_after_n_blinks(stone, n) for stone in stones])
 
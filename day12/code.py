@@ -1,12 +1,11 @@
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import Grid
+from common.inputs import parsed_input
 
 
 class Dummy:
@@ -139,48 +138,51 @@ class Dummy:
 def get_region_area(region_id, regions):
     return len(regions[region_id])
 
-def get_region_perimeter(region_id, regions):
+def get_region_perimeter(region_id, regions, garden):
+    # Two touching plots with the same plant always belong to the same region, so every neighbor with another plant
+    # (or the border around the garden) contributes one fence
     region_perimeter = 0
-    for (i,j) in regions[region_id]:
-        for ii, jj in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]:
-            region_perimeter += (ii, jj) not in regions[region_id]
+    for k in regions[region_id]:
+        for d in garden.N4:
+            region_perimeter += garden[k+d] != garden[k]
     return region_perimeter
 
-def check_neighbor(i, j, ii, jj, garden):
-    return ii >= 0 and jj >= 0 and ii < len(garden) and jj < len(garden[ii]) and garden[i][j] == garden[ii][jj]
+def check_neighbor(k, kk, garden):
+    return garden[kk] == garden[k]
 
 def get_regions(garden):
-    # Region growing
+    # Region growing, one flood fill per region: a plot is marked as soon as it is pushed, so it is added to exactly
+    # one region once, instead of rescanning the whole region for new plots until it stops growing
     regions = {}
-    visited = [[False for x in line] for line in garden]
+    visited = bytearray(len(garden))
     next_region_number = 0
-    for u in range(len(garden)):
-        for v in range(len(garden[u])):
-            if not(visited[u][v]):
-                visited[u][v] = True
-                regions[next_region_number] = [(u,v)]
-            else:
-                continue
-            while True:
-                new_plots_in_region = []
-                for (i,j) in regions[next_region_number]:
-                    for ii, jj in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]:
-                        if (ii, jj) not in regions[next_region_number] and (ii, jj) not in new_plots_in_region and check_neighbor(i, j, ii, jj, garden):
-                            new_plots_in_region.append((ii, jj))
-                if len(new_plots_in_region) > 0:
-                    for (ii, jj) in new_plots_in_region:
-                        regions[next_region_number].append((ii, jj))
-                        visited[ii][jj] = True
-                else:
-                    break
-            next_region_number += 1
+    for u in garden.indices():
+        u = int(u)
+        if not(visited[u]):
+            visited[u] = True
+            regions[next_region_number] = [u]
+        else:
+            continue
+        stack = [u]
+        while len(stack) > 0:
+            k = stack.pop()
+            for d in garden.N4:
+                if not(visited[k+d]) and check_neighbor(k, k+d, garden):
+                    visited[k+d] = True
+                    regions[next_region_number].append(k+d)
+                    stack.append(k+d)
+        next_region_number += 1
     return regions
 
+@parsed_input(mapped=True)
+def load_input(input):
+    garden = Grid.from_view(input.grid())
+    return garden, get_regions(garden)
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    garden = [[x for x in re.findall(r"[a-zA-Z]", line)] for line in input]
-    regions = get_regions(garden)
-    return sum([get_region_perimeter(region_id, regions) * get_region_area(region_id, regions) for region_id in regions.keys()])
+    garden, regions = load_input(input_file_name)
+    return sum([get_region_perimeter(region_id, regions, garden) * get_region_area(region_id, regions) for region_id in regions.keys()])
 
 # 1450816
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -261,42 +263,27 @@ def compute_part_1(input_file_name="input.txt"):
 
 # What is the new total price of fencing all regions on your map?
 
-def get_region_sides(region_id, regions):
-    # First, compute the perimeter while considering sides
-    region_perimeter = []
-    for (i,j) in regions[region_id]:
-        for ii, jj, side in [(i-1, j, 'u'), (i+1, j, 'b'), (i, j-1, 'l'), (i, j+1, 'r')]:
-            if (ii, jj) not in regions[region_id]:
-                region_perimeter.append((ii, jj, side))
-    # Then, remove all parts that are part of the same sides
-    region_sides = []
-    while len(region_perimeter) > 0:
-        (i, j, side) = region_perimeter.pop(0)
-        region_sides.append((i, j))
-        ii = i-1
-        while (ii, j, side) in region_perimeter:
-            region_perimeter.remove((ii, j, side))
-            ii -= 1
-        ii = i+1
-        while (ii, j, side) in region_perimeter:
-            region_perimeter.remove((ii, j, side))
-            ii += 1
-        jj = j-1
-        while (i, jj, side) in region_perimeter:
-            region_perimeter.remove((i, jj, side))
-            jj -= 1
-        jj = j+1
-        while (i, jj, side) in region_perimeter:
-            region_perimeter.remove((i, jj, side))
-            jj += 1
-    return len(region_sides)
+def get_region_sides(region_id, regions, garden):
+    # Every fence piece belongs to exactly one side, so count only the piece at one end of each side: the one whose
+    # plot has no neighbor (turning clockwise) with a fence in the same direction
+    region_sides = 0
+    N4 = garden.N4
+    for k in regions[region_id]:
+        plant = garden[k]
+        for side in range(4):
+            d = N4[side]
+            if garden[k+d] == plant:
+                continue
+            kk = k + N4[(side+1) % 4]
+            if garden[kk] != plant or garden[kk+d] == plant:
+                region_sides += 1
+    return region_sides
 
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    garden = [[x for x in re.findall(r"[a-zA-Z]", line)] for line in input]
-    regions = get_regions(garden)
-    return sum([get_region_sides(region_id, regions) * get_region_area(region_id, regions) for region_id in regions.keys()])
+    garden, regions = load_input(input_file_name)
+    return sum([get_region_sides(region_id, regions, garden) * get_region_area(region_id, regions) for region_id in regions.keys()])
 
 # 865662
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,13 +1,10 @@
 import os.path
-import re
-from scipy.optimize import linprog
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input, split_rows
+from common.parallel import parallel_sum
 
 # --- Day 13: Claw Contraption ---
 
@@ -94,18 +91,21 @@ def brute_force(button_a, button_b, prize, limit):
                 min_tokens = min(min_tokens, 3*i+j)
     return min_tokens
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input if line != '\n']
-    limit = 100
-    sum_tokens = 0
-    while(len(numbers) > 0):
-        button_a = numbers.pop(0)
-        button_b = numbers.pop(0)
-        prize = numbers.pop(0)
-        tokens = brute_force(button_a, button_b, prize, limit)
-        sum_tokens += tokens if tokens < 4 * limit + 1 else 0
-    return sum_tokens
+@parsed_input(mapped=True)
+def load_input(input):
+    numbers = [row for row in split_rows(*input.int_rows()) if len(row) > 0]
+    # Each machine is described by three lines: button A, button B and the prize
+    return [(numbers[k], numbers[k+1], numbers[k+2]) for k in range(0, len(numbers), 3)]
+
+def get_tokens(machine, limit=100):
+    button_a, button_b, prize = machine
+    tokens = brute_force(button_a, button_b, prize, limit)
+    return tokens if tokens < 4 * limit + 1 else 0
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", workers=1):
+    machines = load_input(input_file_name)
+    return parallel_sum(get_tokens, machines, workers)
 
 # 34787
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -143,27 +143,25 @@ def compute_part_1(input_file_name="input.txt"):
 # as possible. What is the fewest tokens you would have to spend to win all 
 # possible prizes?
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"\d+", line)] for line in input if line != '\n']
-    sum_tokens = 0
-    while(len(numbers) > 0):
-        a = numbers.pop(0)
-        b = numbers.pop(0)
-        p = numbers.pop(0)
-        p[0] += 10000000000000
-        p[1] += 10000000000000
-        # i*a[0] + j*b[0] = p[0]
-        # <=> i = (p[0] - j*b[0])/a[0]
-        # i*a[1] + j*b[1] = p[1]
-        # => (p[0] - j*b[0])/a[0] * a[1] + j*b[1] = p[1]
-        # <=> ...
-        # <=> j = (p[1]*a[0] - a[1]*p[0])/(b[1]*a[0] - a[1]*b[0])
-        j = (p[1]*a[0] - a[1]*p[0])/(b[1]*a[0] - a[1]*b[0])
-        i = (p[0] - j*b[0])/a[0]
-        if int(i) == i and int(j) == j:
-            sum_tokens += 3*int(i)+int(j)
-    return sum_tokens
+def get_tokens_corrected(machine):
+    a, b, p = machine
+    p = [p[0] + 10000000000000, p[1] + 10000000000000]
+    # i*a[0] + j*b[0] = p[0]
+    # <=> i = (p[0] - j*b[0])/a[0]
+    # i*a[1] + j*b[1] = p[1]
+    # => (p[0] - j*b[0])/a[0] * a[1] + j*b[1] = p[1]
+    # <=> ...
+    # <=> j = (p[1]*a[0] - a[1]*p[0])/(b[1]*a[0] - a[1]*b[0])
+    j = (p[1]*a[0] - a[1]*p[0])/(b[1]*a[0] - a[1]*b[0])
+    i = (p[0] - j*b[0])/a[0]
+    if int(i) == i and int(j) == j:
+        return 3*int(i)+int(j)
+    return 0
+
+@cached_answer
+def compute_part_2(input_file_name="input.txt", workers=1):
+    machines = load_input(input_file_name)
+    return parallel_sum(get_tokens_corrected, machines, workers)
 
 # 85644161121698
 # That's the right answer! You are one gold star closer to finding the Chief 
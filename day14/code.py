@@ -1,12 +1,10 @@
 import os.path
-import re
-import time
+import sys
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input, split_rows
+from common.progress import Progress, log
 
 # --- Day 14: Restroom Redoubt ---
 # One of The Historians needs to use the bathroom; fortunately, you know 
@@ -181,9 +179,13 @@ class Robot:
             return 4
         return 0
 
+@parsed_input(mapped=True)
+def load_input(input):
+    return split_rows(*input.int_rows(signed=True))
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"-?\d+", line)] for line in input]
+    numbers = load_input(input_file_name)
     robots = [Robot([line[0], line[1]], [line[2], line[3]], [101, 103]) for line in numbers]
     for i in range(100):
         for robot in robots:
@@ -213,10 +215,11 @@ def sum_of_distances_all_to_all(robots):
             sum_of_distances += abs(robots[i].p[0] - robots[j].p[0]) + abs(robots[i].p[1] - robots[j].p[1])
     return sum_of_distances
 
+def format_map(map):
+    return "\n".join(["".join(map[i]) for i in range(len(map))]) + "\n"
+
 def print_map(map):
-    for i in range(len(map)):
-        print("".join(map[i]))
-    print()
+    print(format_map(map))
 
 def get_easter_egg(robots):
     for i in range(7847):
@@ -227,23 +230,27 @@ def get_easter_egg(robots):
         map[robot.p[0]][robot.p[1]] = "X"
     print_map(map)
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    numbers = [[int(x) for x in re.findall(r"-?\d+", line)] for line in input]
+    numbers = load_input(input_file_name)
     robots = [Robot([line[0], line[1]], [line[2], line[3]], [101, 103]) for line in numbers]
     sum_of_distances = sum_of_distances_all_to_all(robots)
+    easter_egg = 0
+    progress = Progress("Moving robots", total=10000)
     for i in range(10000):
         map = [['.' for _ in range(103)] for _ in range(102)]
         for robot in robots:
             robot.move()
             map[robot.p[0]][robot.p[1]] = "X"
-        print(i)
+        progress.update()
         curr_sum_of_distances = sum_of_distances_all_to_all(robots)
         if curr_sum_of_distances < sum_of_distances:
-            print_map(map)
+            # The robots are closest together when they draw the Easter egg; the candidates are shown to check it
+            log(lambda: f"After {i+1} seconds:\n{format_map(map)}")
             sum_of_distances = curr_sum_of_distances
-            time.sleep(0.5)
-    return 0
+            easter_egg = i+1
+    progress.close()
+    return easter_egg
 
 # 7847
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,12 +1,14 @@
 import os.path
 import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.grid import OUTSIDE, Grid
+from common.inputs import parsed_input
+from common.profiling import hot
 
 
 class Dummy:
@@ -292,51 +294,61 @@ class Dummy:
 # Predict the motion of the robot and boxes in the warehouse. After the robot 
 # is finished moving, what is the sum of all boxes' GPS coordinates?
 
-def move(map, dir, i, j):
-    match dir:
-        case '<':
-            ii, jj = i, j-1
-        case 'v':
-            ii, jj = i+1, j
-        case '>':
-            ii, jj = i, j+1
-        case '^':
-            ii, jj = i-1, j
-    if ii < 0 or jj < 0 or ii >= len(map) or jj >= len(map[i]) or map[ii][jj] == '#':
-        return i, j
-    elif map[ii][jj] == '.':
-        map[i][j], map[ii][jj] = map[ii][jj], map[i][j]
-        return ii, jj
-    elif map[ii][jj] == 'O':
-        iii, jjj = move(map, dir, ii, jj) # move the O
-        if ii != iii or jj != jjj:
-            map[i][j], map[ii][jj] = map[ii][jj], map[i][j]
-            return ii, jj
+WALL = ord('#')
+EMPTY = ord('.')
+BOX = ord('O')
+BOX_LEFT = ord('[')
+BOX_RIGHT = ord(']')
+DIRECTIONS = ['^', '>', 'v', '<'] # in the order of Grid.N4
+
+def get_offset(map, dir):
+    return map.N4[DIRECTIONS.index(dir)]
+
+def swap(map, k, kk):
+    map[k], map[kk] = map[kk], map[k]
+
+def move(map, d, k):
+    kk = k + d
+    if map[kk] == WALL or map[kk] == OUTSIDE:
+        return k
+    elif map[kk] == EMPTY:
+        swap(map, k, kk)
+        return kk
+    elif map[kk] == BOX:
+        if move(map, d, kk) != kk: # move the O
+            swap(map, k, kk)
+            return kk
         else:
-            return i, j
+            return k
 
 def find_robot_position(map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == '@':
-                return i, j
+    return map.find_first('@')
+
+def get_gps_coordinates_sum(map, box):
+    i, j = np.divmod(map.find(box), map.stride)
+    return int(np.sum(100*(i - map.border) + j - map.border))
             
 def print_map(map):
-    for line in map:
-        print("".join(line))
+    print(map)
     print()
 
+@parsed_input
+def load_input(input):
+    map = Grid.from_lines([line for line in input if '#' in line])
+    moves = "".join(["".join([x for x in re.findall(r"<|v|>|\^", line)]) for line in input])
+    return map, moves
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"\.|O|#|\@", line)] for line in input if '#' in line]
-    moves = "".join(["".join([x for x in re.findall(r"<|v|>|\^", line)]) for line in input if (d in line for d in ['^', 'v', '>', '<'])])
-    robot_i, robot_j = find_robot_position(map)
+    map, moves = load_input(input_file_name)
+    map = map.copy() # the robot moves the boxes around
+    robot = find_robot_position(map)
     # print_map(map)
     for dir in moves:
-        robot_i, robot_j = move(map, dir, robot_i, robot_j)
+        robot = move(map, get_offset(map, dir), robot)
         # print(f"Move {dir}")
         # print_map(map)
-    return sum([sum([100*i+j if map[i][j] == 'O' else 0 for j in range(len(map[i]))]) for i in range(len(map))])
+    return get_gps_coordinates_sum(map, 'O')
 
 # 1509863
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -531,164 +543,79 @@ def compute_part_1(input_file_name="input.txt"):
 # What is the sum of all boxes' final GPS coordinates?
 
 def scale_map(map):
-    scaled_map = [] 
-    for line in map:
-        scaled_line = []
-        for tile in line:
-            match tile:
-                case '#':
-                    scaled_line.append('#')
-                    scaled_line.append('#')
-                case 'O':
-                    scaled_line.append('[')
-                    scaled_line.append(']')
-                case '.':
-                    scaled_line.append('.')
-                    scaled_line.append('.')
-                case '@':
-                    scaled_line.append('@')
-                    scaled_line.append('.')
-        scaled_map.append(scaled_line)
+    rows = map.rows()
+    scaled_map = Grid.blank(map.height, 2*map.width)
+    scaled_rows = scaled_map.rows()
+    scaled_rows[:, :] = np.repeat(rows, 2, axis=1) # '#' and '.' just double
+    left, right = scaled_rows[:, 0::2], scaled_rows[:, 1::2]
+    left[rows == BOX] = BOX_LEFT
+    right[rows == BOX] = BOX_RIGHT
+    right[rows == ord('@')] = EMPTY
     return scaled_map
 
-def check_possible_scaled_move(map, dir, i, j):
-    match dir:
-        case '<':
-            if j-1 < 0 or map[i][j-1] == '#':
-                return False
-            elif map[i][j-1] == '.':
-                return True
-            elif map[i][j-1] == ']':
-                return check_possible_scaled_move(map, dir, i, j-2)
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case 'v':
-            if i+1 >= len(map) or map[i+1][j] == '#':
-                return False
-            elif map[i+1][j] == '.':
-                return True
-            elif map[i+1][j] == '[':
-                return check_possible_scaled_move(map, dir, i+1, j) and check_possible_scaled_move(map, dir, i+1, j+1)
-            elif map[i+1][j] == ']':
-                return check_possible_scaled_move(map, dir, i+1, j) and check_possible_scaled_move(map, dir, i+1, j-1)
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case '>':
-            if j+1 >= len(map[i]) or map[i][j+1] == '#':
-                return False
-            elif map[i][j+1] == '.':
-                return True
-            elif map[i][j+1] == '[':
-                return check_possible_scaled_move(map, dir, i, j+2)
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case '^':
-            if i-1 < 0 or map[i-1][j] == '#':
-                return False
-            elif map[i-1][j] == '.':
-                return True
-            elif map[i-1][j] == '[':
-                return check_possible_scaled_move(map, dir, i-1, j) and check_possible_scaled_move(map, dir, i-1, j+1)
-            elif map[i-1][j] == ']':
-                return check_possible_scaled_move(map, dir, i-1, j) and check_possible_scaled_move(map, dir, i-1, j-1)
-            else:
-                exit("Unpredicted move; something seems to be off")
-
-def scaled_move(map, dir, i, j):
-    match dir:
-        case '<':
-            if j-1 < 0 or map[i][j-1] == '#':
-                return i, j
-            elif map[i][j-1] == '.':
-                map[i][j], map[i][j-1] = map[i][j-1], map[i][j]
-                return i, j-1
-            elif map[i][j-1] == ']':
-                if check_possible_scaled_move(map, dir, i, j):
-                    scaled_move(map, dir, i, j-2)
-                    map[i][j-2], map[i][j-1] = map[i][j-1], map[i][j-2]
-                    map[i][j], map[i][j-1] = map[i][j-1], map[i][j]
-                    return i, j-1
-                else:
-                    return i, j
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case 'v':
-            if i+1 >= len(map) or map[i+1][j] == '#':
-                return i, j
-            elif map[i+1][j] == '.':
-                map[i][j], map[i+1][j] = map[i+1][j], map[i][j]
-                return i+1, j
-            elif map[i+1][j] == '[':
-               if check_possible_scaled_move(map, dir, i+1, j) and check_possible_scaled_move(map, dir, i+1, j+1):
-                   scaled_move(map, dir, i+1, j)
-                   scaled_move(map, dir, i+1, j+1)
-                   map[i][j], map[i+1][j] = map[i+1][j], map[i][j]
-                   return i+1, j
-               else:
-                   return i, j
-            elif map[i+1][j] == ']':
-                if check_possible_scaled_move(map, dir, i+1, j) and check_possible_scaled_move(map, dir, i+1, j-1):
-                   scaled_move(map, dir, i+1, j)
-                   scaled_move(map, dir, i+1, j-1)
-                   map[i][j], map[i+1][j] = map[i+1][j], map[i][j]
-                   return i+1, j
-                else:
-                   return i, j
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case '>':
-            if j+1 >= len(map[i]) or map[i][j+1] == '#':
-                return i, j
-            elif map[i][j+1] == '.':
-                map[i][j], map[i][j+1] = map[i][j+1], map[i][j]
-                return i, j+1
-            elif map[i][j+1] == '[':
-                if check_possible_scaled_move(map, dir, i, j):
-                    scaled_move(map, dir, i, j+2)
-                    map[i][j+1], map[i][j+2] = map[i][j+2], map[i][j+1]
-                    map[i][j], map[i][j+1] = map[i][j+1], map[i][j]
-                    return i, j+1
-                else:
-                    return i, j
-            else:
-                exit("Unpredicted move; something seems to be off")
-        case '^':
-            if i-1 < 0 or map[i-1][j] == '#':
-                return i, j
-            elif map[i-1][j] == '.':
-                map[i][j], map[i-1][j] = map[i-1][j], map[i][j]
-                return i-1, j
-            elif map[i-1][j] == '[':
-               if check_possible_scaled_move(map, dir, i-1, j) and check_possible_scaled_move(map, dir, i-1, j+1):
-                   scaled_move(map, dir, i-1, j)
-                   scaled_move(map, dir, i-1, j+1)
-                   map[i][j], map[i-1][j] = map[i-1][j], map[i][j]
-                   return i-1, j
-               else:
-                   return i, j
-            elif map[i-1][j] == ']':
-                if check_possible_scaled_move(map, dir, i-1, j) and check_possible_scaled_move(map, dir, i-1, j-1):
-                   scaled_move(map, dir, i-1, j)
-                   scaled_move(map, dir, i-1, j-1)
-                   map[i][j], map[i-1][j] = map[i-1][j], map[i][j]
-                   return i-1, j
-                else:
-                   return i, j
+def is_horizontal(d):
+    return d == 1 or d == -1
+
+def check_possible_scaled_move(map, d, k):
+    kk = k + d
+    if map[kk] == WALL or map[kk] == OUTSIDE:
+        return False
+    elif map[kk] == EMPTY:
+        return True
+    elif is_horizontal(d):
+        if map[kk] == (BOX_RIGHT if d == -1 else BOX_LEFT):
+            return check_possible_scaled_move(map, d, kk + d)
+        else:
+            exit("Unpredicted move; something seems to be off")
+    elif map[kk] == BOX_LEFT:
+        return check_possible_scaled_move(map, d, kk) and check_possible_scaled_move(map, d, kk+1)
+    elif map[kk] == BOX_RIGHT:
+        return check_possible_scaled_move(map, d, kk) and check_possible_scaled_move(map, d, kk-1)
+    else:
+        exit("Unpredicted move; something seems to be off")
+
+@hot
+def scaled_move(map, d, k):
+    kk = k + d
+    if map[kk] == WALL or map[kk] == OUTSIDE:
+        return k
+    elif map[kk] == EMPTY:
+        swap(map, k, kk)
+        return kk
+    elif is_horizontal(d):
+        if map[kk] == (BOX_RIGHT if d == -1 else BOX_LEFT):
+            if check_possible_scaled_move(map, d, k):
+                scaled_move(map, d, kk + d)
+                swap(map, kk, kk + d)
+                swap(map, k, kk)
+                return kk
             else:
-                exit("Unpredicted move; something seems to be off")
-
+                return k
+        else:
+            exit("Unpredicted move; something seems to be off")
+    elif map[kk] == BOX_LEFT or map[kk] == BOX_RIGHT:
+        other_half = kk+1 if map[kk] == BOX_LEFT else kk-1
+        if check_possible_scaled_move(map, d, kk) and check_possible_scaled_move(map, d, other_half):
+            scaled_move(map, d, kk)
+            scaled_move(map, d, other_half)
+            swap(map, k, kk)
+            return kk
+        else:
+            return k
+    else:
+        exit("Unpredicted move; something seems to be off")
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = scale_map([[x for x in re.findall(r"\.|O|#|\@", line)] for line in input if '#' in line])
-    moves = "".join(["".join([x for x in re.findall(r"<|v|>|\^", line)]) for line in input if (d in line for d in ['^', 'v', '>', '<'])])
-    robot_i, robot_j = find_robot_position(map)
+    map, moves = load_input(input_file_name)
+    map = scale_map(map)
+    robot = find_robot_position(map)
     # print_map(map)
     for dir in moves:
-        robot_i, robot_j = scaled_move(map, dir, robot_i, robot_j)
+        robot = scaled_move(map, get_offset(map, dir), robot)
         # print(f"Move {dir}")
         # print_map(map)
-    return sum([sum([100*i+j if map[i][j] == '[' else 0 for j in range(len(map[i]))]) for i in range(len(map))])
+    return get_gps_coordinates_sum(map, '[')
 
 # 1548815
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -1,12 +1,13 @@
 import os.path
-import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import search
+from common.answers import cached_answer
+from common.grid import OUTSIDE, Grid
+from common.inputs import parsed_input
 
 # --- Day 16: Reindeer Maze ---
 
@@ -108,79 +109,60 @@ def read_input(input_file_name):
 # Analyze your map carefully. What is the lowest score a Reindeer could 
 # possibly get?
 
+WALL = ord('#')
+DIRECTIONS = ['^', '>', 'v', '<'] # in the order of Grid.N4, so turning clockwise is adding 1
+
+# A state (tile k, facing DIRECTIONS[dir]) is encoded as the single int 4*k + dir, so distances fit into a flat list
+
 def find_named_tile(map, name):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == name:
-                return i, j
+    return map.find_first(name)
 
 def turn_90_clk(dir):
-    match dir:
-        case '>':
-            return 'v'
-        case 'v':
-            return '<'
-        case '<':
-            return '^'
-        case '^':
-            return '>'
+    return (dir + 1) % 4
 
 def turn_90_cclk(dir):
-    match dir:
-        case '>':
-            return '^'
-        case '^':
-            return '<'
-        case '<':
-            return 'v'
-        case 'v':
-            return '>'
-
-def get_neighbor(i, j, dir):
-    match dir:
-        case '>':
-            return i, j+1
-        case '^':
-            return i-1, j
-        case '<':
-            return i, j-1
-        case 'v':
-            return i+1, j
-
-def shortest_path_distances(si, sj, ti, tj, map):
-    queue = []
-    dist = {}
-    dist[(si, sj, '>')] = 0
-    queue.append((si, sj, '>'))
-    while len(queue) > 0:
-        (i, j, dir) = queue.pop(0)
-        ii, jj = get_neighbor(i, j, dir)
-        if map[ii][jj] != '#':
-            if (ii, jj, dir) in dist.keys() and dist[(ii, jj, dir)] <= dist[(i, j, dir)] + 1:
-                pass
-            else:
-                dist[(ii, jj, dir)] = dist[(i, j, dir)] + 1
-                queue.append((ii, jj, dir))
+    return (dir + 3) % 4
+
+def get_neighbor(map, k, dir):
+    return k + map.N4[dir]
+
+def is_open(map, k):
+    return map[k] != WALL and map[k] != OUTSIDE
+
+def get_moves(map):
+    def moves(state):
+        k, dir = divmod(state, 4)
+        kk = get_neighbor(map, k, dir)
+        if is_open(map, kk):
+            yield 4*kk + dir, 1
         for next_dir in [turn_90_clk(dir), turn_90_cclk(dir)]:
-            if (i, j, next_dir) in dist.keys() and dist[(i, j, next_dir)] <= dist[(i, j, dir)] + 1000:
-                pass
-            else:
-                dist[(i, j, next_dir)] = dist[(i, j, dir)] + 1000
-                queue.append((i, j, next_dir))
-    return dist
+            yield 4*k + next_dir, 1000
+    return moves
+
+def shortest_path_distances(s, map, predecessors=False):
+    # Costs are only 1 and 1000, so a bucket queue beats a heap
+    return search.dial(4*len(map), 4*s + DIRECTIONS.index('>'), get_moves(map), 1000, predecessors=predecessors)
+
+def get_best_end_states(t, dist):
+    reached = [4*t + dir for dir in range(4) if dist[4*t + dir] != search.UNREACHABLE]
+    shortest_path_length = min([dist[state] for state in reached])
+    return shortest_path_length, [state for state in reached if dist[state] == shortest_path_length]
 
 def print_map(map):
-    for line in map:
-        print("".join(line))
+    print(map)
     print()
 
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid())
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    si, sj = find_named_tile(map, 'S')
-    ti, tj = find_named_tile(map, 'E')
-    distances = shortest_path_distances(si, sj, ti, tj, map)
-    return min([distances[(ti, tj, dir)] for dir in ['^', '>', 'v', '<'] if (ti, tj, dir) in distances.keys()])
+    map = load_input(input_file_name)
+    s = find_named_tile(map, 'S')
+    t = find_named_tile(map, 'E')
+    distances = shortest_path_distances(s, map)
+    return get_best_end_states(t, distances)[0]
 
 # 98520
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -244,45 +226,20 @@ def compute_part_1(input_file_name="input.txt"):
 # Analyze your map further. How many tiles are part of at least one of the 
 # best paths through the maze?
 
-def get_predecessor(i, j, dir):
-    match dir:
-        case '>':
-            return i, j-1
-        case '^':
-            return i+1, j
-        case '<':
-            return i, j+1
-        case 'v':
-            return i-1, j
-
-def backtrack_best_paths(si, sj, ti, tj, dist):
-    tiles = []
-    queue = []
-    shortest_path_length = min([dist[(ti, tj, dir)] for dir in ['^', '>', 'v', '<'] if (ti, tj, dir) in dist.keys()])
-    for dir in ['^', '>', 'v', '<']:
-        if (ti, tj, dir) in dist.keys() and dist[(ti, tj, dir)] == shortest_path_length:
-            queue.append((ti, tj, dir)) 
-            tiles.append((ti, tj))
-    while len(queue) > 0:
-        (i, j, dir) = queue.pop(0)
-        ii, jj = get_predecessor(i, j, dir)
-        if (ii, jj, dir) in dist.keys() and dist[(ii, jj, dir)] == dist[(i, j, dir)]-1:
-            if (ii, jj) not in tiles:
-                tiles.append((ii, jj))
-            queue.append((ii, jj, dir))
-        for prev_dir in [turn_90_clk(dir), turn_90_cclk(dir)]:
-            if (i, j, prev_dir) in dist.keys() and dist[(i, j, prev_dir)] == dist[(i, j, dir)]-1000:
-                queue.append((i, j, prev_dir))
-    return tiles
-
+def backtrack_best_paths(t, dist, preds):
+    # Every state on a best path lies in the predecessor DAG of the best end states; a tile counts once for all its
+    # directions
+    _, end_states = get_best_end_states(t, dist)
+    states = np.frombuffer(search.on_shortest_paths(preds, end_states), dtype=np.uint8)
+    return states.reshape(-1, 4).any(axis=1)
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in line.replace('\n', '')] for line in input]
-    si, sj = find_named_tile(map, 'S')
-    ti, tj = find_named_tile(map, 'E')
-    distances = shortest_path_distances(si, sj, ti, tj, map)
-    return len(backtrack_best_paths(si, sj, ti, tj, distances))
+    map = load_input(input_file_name)
+    s = find_named_tile(map, 'S')
+    t = find_named_tile(map, 'E')
+    distances, predecessors = shortest_path_distances(s, map, predecessors=True)
+    return int(np.count_nonzero(backtrack_best_paths(t, distances, predecessors)))
 
 # 609
 # That's the right answer! You are one gold star closer to finding the Chief 
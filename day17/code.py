@@ -1,12 +1,12 @@
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()   
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.profiling import hot
+from common.progress import Progress
 
 # --- Day 17: Chronospatial Computer ---
 
@@ -130,6 +130,7 @@ class Computer:
         self.reg_c = registers[2]
         self.program = program
     
+    @hot
     def run(self):
         while self.ip < len(self.program):
             opcode, operand = self.program[self.ip], self.program[self.ip+1]
@@ -191,10 +192,15 @@ class Computer:
     def cdv(self, operand):
         self.reg_c = self.reg_a//pow(2, self.combo(operand))
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+@parsed_input
+def load_input(input):
     registers = [[int(x) for x in re.findall(r"\d+", line)][0] for line in input if "Register" in line]
     program = [[int(x) for x in re.findall(r"\d+", line)] for line in input if "Program" in line][0]
+    return registers, program
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt"):
+    registers, program = load_input(input_file_name)
     computer = Computer(registers, program)
     computer.run()
     return computer.output
@@ -224,20 +230,21 @@ def compute_part_1(input_file_name="input.txt"):
 # What is the lowest positive initial value for register A that causes the 
 # program to output a copy of itself?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    registers = [[int(x) for x in re.findall(r"\d+", line)][0] for line in input if "Register" in line]
-    program = [[int(x) for x in re.findall(r"\d+", line)] for line in input if "Program" in line][0]
+    registers, program = load_input(input_file_name)
     reg_a = 0 # Insight: If reg_a increases, so does the length of the output
     n_correct_digits = 0
+    progress = Progress("Matching digits of the program", total=len(program))
     while True:
         computer = Computer(registers, program)
         computer.reg_a = reg_a
         computer.run()
         if computer.output_list == program:
+            progress.close()
             return reg_a
         if computer.output_list[-(n_correct_digits+1):] == program[-(n_correct_digits+1):]:
-            print(f"{reg_a}: {computer.output_list} vs {program}")
+            progress.update(message=lambda: f"{reg_a}: {computer.output_list} vs {program}")
             reg_a *= 8 # Insight: If all digits match, we can safely multiply by 8
             n_correct_digits += 1
         else:
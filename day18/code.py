@@ -1,12 +1,12 @@
 import os.path
-import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import search
+from common.answers import cached_answer
+from common.grid import Grid
+from common.inputs import parsed_input, split_rows
+from common.progress import DEBUG, Progress, log
 
 # --- Day 18: RAM Run ---
 
@@ -97,40 +97,41 @@ def read_input(input_file_name):
 # Simulate the first kilobyte (1024 bytes) falling onto your memory space. 
 # Afterward, what is the minimum number of steps needed to reach the exit?
 
+CORRUPTED = ord('#')
+SAFE = ord('.')
+
 def print_memory(memory):
-    for line in memory:
-        print("".join(line))
-    print()
-
-def get_neighbors(x, y, memory):
-    return [(xx, yy) for (xx, yy) in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)] if yy >= 0 and yy < len(memory) and xx >= 0 and xx < len(memory[yy])]
-
-def shortest_path(sx, sy, tx, ty, memory):
-    queue = [(sx, sy)]
-    dist = {
-        (sx, sy) : 0
-    }
-    while(len(queue) > 0):
-        (x, y) = queue.pop(0)
-        for xx, yy in get_neighbors(x, y, memory):
-            if (xx, yy) in dist:
-                continue
-            if memory[xx][yy] == '.':
-                dist[(xx, yy)] = dist[(x, y)] + 1
-                queue.append((xx, yy))
-    return dist[(tx, ty)] if (tx, ty) in dist else -1
+    log(lambda: f"{memory}\n", DEBUG)
+
+def shortest_path(s, t, memory):
+    # The border around the memory space is never SAFE, so neighbors need no bounds check
+    N4 = memory.N4
+    cells = memory.cells
+    def neighbors(k):
+        return [k + d for d in N4 if cells[k + d] == SAFE]
+    return search.bfs(len(memory), s, neighbors, target=t)[t]
+
+def corrupt_memory(bytes, grid_size):
+    memory = Grid.blank(grid_size, grid_size)
+    for (x, y) in bytes:
+        memory[memory.index(y, x)] = CORRUPTED
+    return memory
         
 def size_2_list_to_pair(size_2_list):
     if len(size_2_list) != 2:
         exit(f"Tried transforming list {size_2_list} of size {len(size_2_list)} to pair.")
     return (size_2_list[0], size_2_list[1])
 
+@parsed_input(mapped=True)
+def load_input(input):
+    return [size_2_list_to_pair(row) for row in split_rows(*input.int_rows())]
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    bytes = [size_2_list_to_pair([int(x) for x in re.findall(r"\d+", line)]) for line in input][:1024]
+    bytes = load_input(input_file_name)[:1024]
     grid_size = 71
-    memory = [['#' if (x, y) in bytes else '.' for x in range(grid_size)] for y in range(grid_size)]
-    return shortest_path(0, 0, grid_size-1, grid_size-1, memory)
+    memory = corrupt_memory(bytes, grid_size)
+    return shortest_path(memory.index(0, 0), memory.index(grid_size-1, grid_size-1), memory)
 
 # 264
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -173,18 +174,21 @@ def compute_part_1(input_file_name="input.txt"):
 # being reachable from your starting position? (Provide the answer as two 
 # integers separated by a comma with no other characters.)
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    bytes = [size_2_list_to_pair([int(x) for x in re.findall(r"\d+", line)]) for line in input]
+    bytes = load_input(input_file_name)
     grid_size = 71
-    memory = [['#' if (x, y) in bytes[:1024] else '.' for x in range(grid_size)] for y in range(grid_size)]
+    memory = corrupt_memory(bytes[:1024], grid_size)
     print_memory(memory)
+    progress = Progress("Simulating bytes", total=len(bytes)-1024)
     for i in range(1024, len(bytes)):
-        memory[bytes[i][1]][bytes[i][0]] = '#'
-        # print(f"Simulating byte {i}: {bytes[i]}")
-        shortest_path_length = shortest_path(0, 0, grid_size-1, grid_size-1, memory)
+        memory[memory.index(bytes[i][1], bytes[i][0])] = CORRUPTED
+        progress.update(message=lambda: f"byte {i}: {bytes[i]}")
+        shortest_path_length = shortest_path(memory.index(0, 0), memory.index(grid_size-1, grid_size-1), memory)
         if shortest_path_length == -1:
+            progress.close()
             return f"{bytes[i][0]},{bytes[i][1]}"
+    progress.close()
     return "-1,-1"
 
 # 41,26
@@ -1,12 +1,13 @@
+import functools
 import os.path
 import re
-import functools
+import sys
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.parallel import map_reduce, parallel_sum
+from common.profiling import hot
 
 # --- Day 19: Linen Layout ---
 
@@ -90,16 +91,16 @@ def check_design_possible(design, patterns):
             return True
     return False
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    available_patterns = [x for x in re.findall(r"[a-z]+", input[0])]
+@parsed_input
+def load_input(input):
+    patterns = [x for x in re.findall(r"[a-z]+", input[0])]
     designs = [x.replace('\n', '') for x in input[2:]]
-    n_possible_designs = 0
-    for design in designs:
-        if check_design_possible(design, available_patterns):
-            # print(f"Design {design} is possible")
-            n_possible_designs += 1
-    return n_possible_designs
+    return patterns, designs
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", workers=1):
+    available_patterns, designs = load_input(input_file_name)
+    return parallel_sum(functools.partial(check_design_possible, patterns=available_patterns), designs, workers)
 
 # 233
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -144,8 +145,10 @@ def compute_part_1(input_file_name="input.txt"):
 # get if you add up the number of different ways you could make each design?
 
 available_patterns = []
+DESIGN_CACHE_SIZE = 1 << 16 # bounded for long-lived processes; one input needs about 11k entries
 
-@functools.cache
+@functools.lru_cache(maxsize=DESIGN_CACHE_SIZE)
+@hot # below the cache, so only designs that are actually computed count
 def count_possible_designs(design):
     if design == "":
         return 1
@@ -155,16 +158,22 @@ def count_possible_designs(design):
             n_possible_designs += count_possible_designs(design[len(pattern):])
     return n_possible_designs
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+def count_all_possible_designs(patterns, designs):
+    # Runs in the workers as well, which receive their own copy of the patterns with every chunk
     global available_patterns
-    available_patterns = [x for x in re.findall(r"[a-z]+", input[0])]
-    designs = [x.replace('\n', '') for x in input[2:]]
+    if patterns != available_patterns:
+        count_possible_designs.cache_clear() # the cached counts only hold for the patterns they were computed with
+        available_patterns = patterns
     n_possible_designs = 0
     for design in designs:
         n_possible_designs += count_possible_designs(design)
     return n_possible_designs
 
+@cached_answer
+def compute_part_2(input_file_name="input.txt", workers=1):
+    patterns, designs = load_input(input_file_name)
+    return map_reduce(functools.partial(count_all_possible_designs, patterns), designs, workers=workers)
+
 # 691316989225259
 # That's the right answer! You are one gold star closer to finding the Chief 
 # Historian.
@@ -1,12 +1,13 @@
 import os.path
-import re
+import sys
 
+import numpy as np
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import search
+from common.answers import cached_answer
+from common.grid import OUTSIDE, Grid
+from common.inputs import parsed_input
 
 # --- Day 20: Race Condition ---
 
@@ -156,87 +157,63 @@ def read_input(input_file_name):
 # give yourself as many options as possible, you'll need a list of the best 
 # cheats. How many cheats would save you at least 100 picoseconds?
 
+WALL = ord('#')
+
 def print_map(map):
-    for line in map:
-        print("".join(line))
+    print(map)
     print()
 
 def find_position(pos_name, map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == pos_name:
-                return (i, j)
-    return (-1, -1)
-
-def get_all_neighbors(i, j, map):
-    return [(ii, jj) for (ii, jj) in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)] if ii >= 0 and ii < len(map) and jj >= 0 and jj < len(map[i])]
-
-def get_track_neighbors(i, j, map):
-    return [(ii, jj) for (ii, jj) in get_all_neighbors(i, j, map) if map[ii][jj] != '#']
-
-def get_wall_neighbors(i, j, map):
-    return [(ii, jj) for (ii, jj) in get_all_neighbors(i, j, map) if map[ii][jj] == '#']
-
-def get_shortest_path_distances(si, sj, map):
-    queue = [(si, sj)]
-    shortest_path_distances = {
-        (si, sj) : 0
-    }
-    while(len(queue) > 0):
-        (i, j) = queue.pop(0)
-        for ii, jj in get_track_neighbors(i, j, map):
-            if (ii, jj) in shortest_path_distances:
-                continue
-            shortest_path_distances[(ii, jj)] = shortest_path_distances[(i, j)] + 1
-            queue.append((ii, jj))
-    return shortest_path_distances
-
-def get_shortest_path_positions(ti, tj, shortest_path_distances, map):
-    shortest_path_positions = [(ti, tj)]
+    return map.find_first(pos_name)
+
+def get_track_neighbors(k, map):
+    return [k + d for d in map.N4 if map[k + d] != WALL and map[k + d] != OUTSIDE]
+
+def get_shortest_path_distances(s, map):
+    return search.bfs(len(map), s, lambda k: get_track_neighbors(k, map))
+
+def get_shortest_path_positions(t, shortest_path_distances, map):
+    shortest_path_positions = [t]
     while shortest_path_distances[shortest_path_positions[-1]] != 0:
-        (i, j) = shortest_path_positions[-1]
-        for (ii, jj) in get_track_neighbors(i, j, map):
-            if shortest_path_distances[(i, j)] == shortest_path_distances[(ii, jj)] + 1:
-                shortest_path_positions.append((ii, jj))
+        k = shortest_path_positions[-1]
+        for kk in get_track_neighbors(k, map):
+            if shortest_path_distances[k] == shortest_path_distances[kk] + 1:
+                shortest_path_positions.append(kk)
     shortest_path_positions.reverse() # Starts with ['S', '.', ..., 'E']
     return shortest_path_positions
 
-def get_stop_cheat_positions(c1i, c1j, initial_candidates, cheat_distance, map):
-    # Collect all track positions that are reachable from (c1i, c1j) while cheating for at most cheat_distance
-    queue = [(c1i, c1j)]
-    dist = {
-        (c1i, c1j) : 0
-    }
-    while(len(queue) > 0):
-        (i, j) = queue.pop(0)
-        if dist[(i, j)] >= cheat_distance:
-            continue
-        for (ii, jj) in get_all_neighbors(i, j, map):
-            if (ii, jj) in dist:
-                continue
-            dist[(ii, jj)] = dist[(i, j)] + 1
-            queue.append((ii, jj))
-    return {pos : dist[pos] for pos in dist.keys() if pos in initial_candidates}
+def get_cheat_offsets(cheat_distance, map):
+    # While cheating, walls do not matter, so the positions reachable within cheat_distance are exactly those within
+    # that Manhattan distance (clipped to the map, which the border takes care of)
+    return [(di * map.stride + dj, abs(di) + abs(dj)) for di in range(-cheat_distance, cheat_distance+1) for dj in range(-cheat_distance + abs(di), cheat_distance - abs(di) + 1)]
 
 def compute(map, cheat_distance, min_time_to_save):
-    (si, sj) = find_position("S", map)
-    (ti, tj) = find_position("E", map)
-    shortest_path_distances_to_s = get_shortest_path_distances(si, sj, map)
-    shortest_path_distances_to_t = get_shortest_path_distances(ti, tj, map)
-    orginial_distance = shortest_path_distances_to_s[(ti, tj)]
-    cheats = {}
+    if cheat_distance > map.border:
+        exit(f"Cheats of length {cheat_distance} reach past the border of size {map.border}.")
+    s = find_position("S", map)
+    t = find_position("E", map)
+    shortest_path_distances_to_s = np.array(get_shortest_path_distances(s, map), dtype=np.int64)
+    shortest_path_distances_to_t = np.array(get_shortest_path_distances(t, map), dtype=np.int64)
+    orginial_distance = shortest_path_distances_to_s[t]
     # Cheat start position needs to be reachable from S; cheat end positions needs to reach t
-    for (c1i, c1j) in shortest_path_distances_to_s.keys():
-        c2s = get_stop_cheat_positions(c1i, c1j, shortest_path_distances_to_t.keys(), cheat_distance, map)
-        for (c2i, c2j) in c2s.keys():
-            dist = shortest_path_distances_to_s[c1i, c1j] + c2s[c2i, c2j] + shortest_path_distances_to_t[c2i, c2j]
-            if dist <= orginial_distance - min_time_to_save:
-                cheats[(c1i, c1j, c2i, c2j)] = dist
-    return len(cheats)
-
+    c1s = np.flatnonzero(shortest_path_distances_to_s != search.UNREACHABLE)
+    to_s = shortest_path_distances_to_s[c1s]
+    to_t = np.where(shortest_path_distances_to_t == search.UNREACHABLE, len(map), shortest_path_distances_to_t) # never short enough
+    # Every (start, offset) pair is a distinct cheat, so counting them per offset needs no set of seen (start, end)
+    # pairs; walls and the border cannot reach E, so no cheat ends there
+    cheats = 0
+    for offset, cheat_length in get_cheat_offsets(cheat_distance, map):
+        dist = to_s + cheat_length + to_t[c1s + offset]
+        cheats += int(np.count_nonzero(dist <= orginial_distance - min_time_to_save))
+    return cheats
+
+@parsed_input(mapped=True)
+def load_input(input):
+    return Grid.from_view(input.grid(), border=20)
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"\.|\#|S|E", line)] for line in input]
+    map = load_input(input_file_name)
     return compute(map, 2, 100)
     
 # 1321
@@ -317,9 +294,9 @@ def compute_part_1(input_file_name="input.txt"):
 # Find the best cheats using the updated cheating rules. How many cheats 
 # would save you at least 100 picoseconds?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    map = [[x for x in re.findall(r"\.|\#|S|E", line)] for line in input]
+    map = load_input(input_file_name)
     return compute(map, 20, 100)
 
 # 971737
@@ -1,11 +1,11 @@
-import os.path
 import functools
+import os.path
+import sys
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import search
+from common.answers import cached_answer
+from common.inputs import parsed_input
 
 # --- Day 21: Keypad Conundrum ---
 
@@ -213,29 +213,20 @@ def get_optimal_sequence(s, t):
 # Get all possible sequences that form a shortest path from current_pos to the pos with target_button
 # Only use this for the Numeric Keypad
 def get_shortest_path_sequences(target_button, current_pos, keypad):
-        queue = [current_pos]
-        sequences = {current_pos : ['']}
         # We are in fact only interested in the "best" sequence, but finding that is a bit difficult
         # since there are not only rules to follow (e.g. never go over the empty space) but also
         # orders of operations that are better than others (e.g. '<<^' better than '<^<' and more complicated).
         # Since there are not that many possibilities for entering the number on the Numeric Keybad, we just
-        # look at all of them.
-        while len(queue) > 0:
-            (i, j) = queue.pop(0)
-            for ii, jj, dir in [(i-1, j, '^'), (i, j+1, '>'), (i+1, j, 'v'), (i, j-1, '<')]:
-                if ii >= 0 and ii < len(keypad) and jj >= 0 and jj < len(keypad[ii]) and keypad[ii][jj] != '':
-                    if (ii, jj) not in sequences.keys():
-                        queue.append((ii, jj))
-                        sequences[(ii, jj)] = []
-                        for seq in sequences[(i, j)]:
-                            if (seq + dir) not in sequences[(ii, jj)]: 
-                                sequences[(ii, jj)].append(seq + dir)
-                    elif len(sequences[(ii,jj)][0]) >= len(sequences[(i,j)][0]) + 1:
-                        queue.append((ii, jj))
-                        for seq in sequences[(i, j)]:
-                            if (seq + dir) not in sequences[(ii, jj)]: 
-                                sequences[(ii, jj)].append(seq + dir)
-        return [seq + 'A' for seq in sequences[find_pos(target_button, keypad)]]
+        # look at all of them: every path in the DAG of shortest paths is one sequence.
+        width = len(keypad[0])
+        def neighbors(k):
+            (i, j) = divmod(k, width)
+            return [ii*width + jj for ii, jj in [(i-1, j), (i, j+1), (i+1, j), (i, j-1)] if ii >= 0 and ii < len(keypad) and jj >= 0 and jj < width and keypad[ii][jj] != '']
+        directions = {-width : '^', 1 : '>', width : 'v', -1 : '<'}
+        (i, j) = current_pos
+        (ti, tj) = find_pos(target_button, keypad)
+        _, predecessors = search.bfs(len(keypad) * width, i*width + j, neighbors, predecessors=True)
+        return ["".join([directions[path[k+1] - path[k]] for k in range(len(path)-1)]) + 'A' for path in search.shortest_paths(predecessors, ti*width + tj)]
 
 def get_sequences_from_numeric_keypad(code, numeric_keypad):
     pos = find_pos("A", numeric_keypad)
@@ -294,9 +285,13 @@ def compute(codes, n_directional_keypads):
         sum_of_complexities += min(button_counts) * int(code.replace('A', ''))
     return sum_of_complexities
 
+@parsed_input
+def load_input(input):
+    return [line.replace('\n', '') for line in input]
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    codes = [line.replace('\n', '') for line in input]
+    codes = load_input(input_file_name)
     return compute(codes, 2)
 
 # 136780
@@ -333,9 +328,9 @@ def compute_part_1(input_file_name="input.txt"):
 # cause the robot in front of the door to type each code. What is the sum of 
 # the complexities of the five codes on your list?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    codes = [line.replace('\n', '') for line in input]
+    codes = load_input(input_file_name)
     return compute(codes, 25)
 
 # 167538833832712
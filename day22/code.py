@@ -1,11 +1,12 @@
-import os.path
 import functools
+import os.path
+import sys
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.parallel import map_reduce, parallel_sum
+from common.profiling import hot
 
 # --- Day 22: Monkey Market ---
 
@@ -103,28 +104,38 @@ def read_input(input_file_name):
 # For each buyer, simulate the creation of 2000 new secret numbers. What is 
 # the sum of the 2000th secret number generated by each buyer?
 
-@functools.cache
+# Secret numbers rarely repeat, so the cache of evolve is bounded (an unbounded one grew to millions of entries and
+# gigabytes for a single input). mix and prune are cheaper to compute than to look up.
+EVOLVE_CACHE_SIZE = 1 << 16
+
 def mix(x, y):
     return x ^ y
 
-@functools.cache
 def prune(x):
     return x % 16777216
 
-@functools.cache
+@functools.lru_cache(maxsize=EVOLVE_CACHE_SIZE)
+@hot
 def evolve(x):
     x = prune(mix(x, x*64))
     x = prune(mix(x, x//32))
     x = prune(mix(x, x*2048))
     return x
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    secret_numbers = [int(line.replace('\n', '')) for line in input]
-    for k in range(len(secret_numbers)):
-        for _ in range(2000):    
-            secret_numbers[k] = evolve(secret_numbers[k])
-    return sum(secret_numbers)
+@parsed_input(mapped=True)
+def load_input(input):
+    numbers, _ = input.int_rows()
+    return numbers.tolist()
+
+def evolve_2000(secret_number):
+    for _ in range(2000):
+        secret_number = evolve(secret_number)
+    return secret_number
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt", workers=1):
+    secret_numbers = load_input(input_file_name)
+    return parallel_sum(evolve_2000, secret_numbers, workers)
 
 # 13461553007
 # That's the right answer! You are one gold star closer to finding the Chief 
@@ -229,9 +240,7 @@ def compute_part_1(input_file_name="input.txt"):
 # same sequence of changes in every buyer's future prices, you get the most 
 # bananas in total. What is the most bananas you can get?
 
-def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    secret_numbers = [int(line.replace('\n', '')) for line in input]
+def collect_bananas(secret_numbers):
     cstb = {} # Maps Change Sequences to Numbers of 
     for secret_number in secret_numbers:
         prices = [secret_number%10]
@@ -249,6 +258,18 @@ def compute_part_2(input_file_name="input.txt"):
         # Update overall Map
         for change_sequence in local_ctsb:
             cstb[change_sequence] = cstb.get(change_sequence, 0) + local_ctsb[change_sequence]
+    return cstb
+
+def merge_bananas(cstb, other):
+    for change_sequence in other:
+        cstb[change_sequence] = cstb.get(change_sequence, 0) + other[change_sequence]
+    return cstb
+
+@cached_answer
+def compute_part_2(input_file_name="input.txt", workers=1):
+    secret_numbers = load_input(input_file_name)
+    # Every worker maps the change sequences of its buyers, the maps are merged afterwards
+    cstb = map_reduce(collect_bananas, secret_numbers, merge_bananas, {}, workers)
     return max(cstb.values())
 
 # 1499
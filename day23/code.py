@@ -1,11 +1,11 @@
 import os.path
 import re
+import sys
 
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.progress import Progress
     
 # --- Day 23: LAN Party ---
 
@@ -102,10 +102,14 @@ def get_network_map(connections):
         network_map.setdefault(c2, []).append(c1)
     return network_map
 
-def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
+@parsed_input
+def load_input(input):
     connections = ["".join([x for x in re.findall(r"[a-z]{2}\-[a-z]{2}", line)]) for line in input]
-    network_map = get_network_map(connections)
+    return get_network_map(connections)
+
+@cached_answer
+def compute_part_1(input_file_name="input.txt"):
+    network_map = load_input(input_file_name)
     trios = []
     for c1 in network_map.keys():
         for c2 in network_map[c1]:
@@ -156,13 +160,14 @@ def get_password(computers):
 
 # What is the password to get into the LAN party?
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    connections = ["".join([x for x in re.findall(r"[a-z]{2}\-[a-z]{2}", line)]) for line in input]
-    network_map = get_network_map(connections)
+    network_map = load_input(input_file_name)
     pairwise_connected_pcs = [[c] for c in network_map.keys()]
-    for i in range(1, max([len(network_map[c]) for c in network_map.keys()]) + 1):
-        print(f"{len(pairwise_connected_pcs)} sets of {i} pairwise connected Computers")
+    max_set_size = max([len(network_map[c]) for c in network_map.keys()])
+    progress = Progress("Growing sets of pairwise connected Computers", total=max_set_size)
+    for i in range(1, max_set_size + 1):
+        progress.update(message=lambda: f"{len(pairwise_connected_pcs)} sets of {i} pairwise connected Computers")
         next_pairwise_connected_pcs = []
         for c_list in pairwise_connected_pcs:
             candidates = [c_new for c_new in network_map[c_list[0]] if all(c_new in network_map[c] for c in c_list[1:])]
@@ -171,6 +176,7 @@ def compute_part_2(input_file_name="input.txt"):
                 if(c_list_new not in next_pairwise_connected_pcs):
                     next_pairwise_connected_pcs.append(c_list_new)
         if len(next_pairwise_connected_pcs) == 0:
+            progress.close()
             return get_password(pairwise_connected_pcs[0])
         pairwise_connected_pcs = next_pairwise_connected_pcs
     return -1
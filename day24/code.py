@@ -1,12 +1,11 @@
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
+from common.progress import Progress
 
 # --- Day 24: Crossed Wires ---
 
@@ -198,7 +197,8 @@ class Gate:
             case "XOR":
                 return self.i1 != self.i2
 
-def parse_input(input):
+@parsed_input
+def load_input(input):
     values = {}
     gates = []
     for line in input:
@@ -206,12 +206,17 @@ def parse_input(input):
             values[line[0:3]] = True if ': 1' in line else False
         elif '->' in line:
             i1_name, type, i2_name, o_name = re.match(r"(\w+)\s+(XOR|AND|OR)\s+(\w+)\s+->\s+(\w+)", line).groups()
-            gates.append(Gate(type, i1_name, i2_name, o_name))
+            gates.append((type, i1_name, i2_name, o_name))
     return values, gates
 
+def parse_input(input_file_name):
+    # Gates are modified while evaluating and swapping outputs, so every part gets its own
+    values, gates = load_input(input_file_name)
+    return values.copy(), [Gate(*gate) for gate in gates]
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    values, gates = parse_input(input)
+    values, gates = parse_input(input_file_name)
     while(len(gates)) > 0:
         for gate in gates:
             for val in [gate.i1_name, gate.i2_name]:
@@ -394,9 +399,9 @@ def check_rule_1(gate): # returns True in case of rule violation
 def check_rule_2(gate): # returns True in case of rule violation
     return gate.o_name[0] != 'z' and ((gate.i1_name[0]+gate.i2_name[0]) not in ["xy", "yx"]) and gate.type == "XOR"
 
+@cached_answer
 def compute_part_2(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    values, gates = parse_input(input)
+    values, gates = parse_input(input_file_name)
     # Rules for finding errors (based on how a Ripple Carry Adder is supposed to work):
     # - If a gate outputs z.., then the operation has to be XOR unless it is the last bit.
     # - If a gate does not output z.. and the inputs are not x.. and y.. then it has to be AND / OR, but not XOR.
@@ -412,12 +417,15 @@ def compute_part_2(input_file_name="input.txt"):
             remaining_gates.append(gate)
     # This produces 6 faulty gates
     # For any reminding errors, we use brute force
+    progress = Progress("Testing pairs of remaining gates", total=len(remaining_gates)*len(remaining_gates))
     for i in range(len(remaining_gates)):
         for j in range(len(remaining_gates)):
             potentially_faulty_gates = faulty_gates_rule_1 + faulty_gates_rule_2 + [remaining_gates[i], remaining_gates[j]]
-            print(f"{i*len(remaining_gates) + j}/{len(remaining_gates)*len(remaining_gates)//2}") # Result found at i*n_gates + j = 1016
+            progress.update() # Result found at i*n_gates + j = 1016
             if test_fix_gate_combinations(values, gates, potentially_faulty_gates):
+                progress.close()
                 return "".join(sorted([gate.o_name + ',' for gate in potentially_faulty_gates]))[:-1]
+    progress.close()
     return 0
 
 # kcd,pfn,shj,tpk,wkb,z07,z23,z27
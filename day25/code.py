@@ -1,12 +1,10 @@
 import os.path
 import re
+import sys
 
-
-def read_input(input_file_name):
-    input_file = os.path.join(os.path.dirname(__file__), input_file_name)
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-        return lines
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.answers import cached_answer
+from common.inputs import parsed_input
 
 
 class Dummy:
@@ -184,9 +182,13 @@ def fit(key, lock):
             return False
     return True
 
+@parsed_input
+def load_input(input):
+    return get_schematics(input)
+
+@cached_answer
 def compute_part_1(input_file_name="input.txt"):
-    input = read_input(input_file_name)
-    keys, locks = get_schematics(input)
+    keys, locks = load_input(input_file_name)
     return sum([sum([1 if fit(key, lock) else 0 for lock in locks]) for key in keys])
 
 # 3155